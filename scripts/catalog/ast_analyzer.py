@@ -3,22 +3,66 @@
 from __future__ import annotations
 
 import ast
+import functools
+import os
 from pathlib import Path
 from typing import Optional
 
 
-def _parse_python_file(file_path: Path) -> Optional[ast.AST]:
+# Files kept in memory, as source and as parsed trees. The checks for one
+# file's rules run back to back, so this only needs to cover a few files.
+AST_CACHE_SIZE = 64
+
+
+def _parse_python_file(file_path: Path, needle: Optional[str] = None) -> Optional[ast.AST]:
     """Parse a Python file and return its AST.
 
+    Trees are cached by path, mtime, and size, so several checks on the same
+    file share one parse. They must not be modified.
+
+    Args:
+        file_path: Path to the Python file.
+        needle: Optional identifier the caller needs in the tree. ASCII files
+            that do not contain it are not parsed and return None. Files with
+            other characters are always parsed, since identifiers are NFKC
+            normalized and may be spelled differently in the source.
+
     Returns None if the file cannot be parsed (not Python, syntax error, etc.)
     """
     if file_path.suffix.lower() != ".py":
         return None
 
     try:
-        content = file_path.read_text(encoding="utf-8")
-        return ast.parse(content, filename=str(file_path))
-    except (SyntaxError, UnicodeDecodeError, IOError):
+        st = file_path.stat()
+    except OSError:
+        return None
+
+    key = (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+    if needle:
+        content = _read_python_file_cached(*key)
+        if content is None or (needle not in content and content.isascii()):
+            return None
+    return _parse_python_file_cached(*key)
+
+
+@functools.lru_cache(maxsize=AST_CACHE_SIZE)
+def _read_python_file_cached(path: str, mtime_ns: int, size: int) -> Optional[str]:
+    """Read a Python file as UTF-8 (cached by path, mtime, and size)."""
+    try:
+        return Path(path).read_text(encoding="utf-8")
+    except (UnicodeDecodeError, IOError):
+        return None
+
+
+@functools.lru_cache(maxsize=AST_CACHE_SIZE)
+def _parse_python_file_cached(path: str, mtime_ns: int, size: int) -> Optional[ast.AST]:
+    """Parse a Python file (cached by path, mtime, and size)."""
+    content = _read_python_file_cached(path, mtime_ns, size)
+    if content is None:
+        return None
+    try:
+        return ast.parse(content, filename=path)
+    except SyntaxError:
         return None
 
 
@@ -72,7 +116,8 @@ def check_class_inherits(file_path: str | Path, name: str) -> bool:
     Returns:
         True if any class directly inherits from the specified name.
     """
-    tree = _parse_python_file(Path(file_path))
+    # The last part of the name is an identifier that must appear as written
+    tree = _parse_python_file(Path(file_path), needle=name.rpartition(".")[2])
     if tree is None:
         return False
 
@@ -99,7 +144,7 @@ def check_decorator(file_path: str | Path, name: str) -> bool:
     Returns:
         True if any function/class is decorated with the specified name.
     """
-    tree = _parse_python_file(Path(file_path))
+    tree = _parse_python_file(Path(file_path), needle=name.rpartition(".")[2])
     if tree is None:
         return False
 
@@ -125,7 +170,8 @@ def check_has_main_block(file_path: str | Path) -> bool:
     Returns:
         True if the file has a top-level main block.
     """
-    tree = _parse_python_file(Path(file_path))
+    # "__main__" may be spelled with escapes, but __name__ cannot be
+    tree = _parse_python_file(Path(file_path), needle="__name__")
     if tree is None:
         return False
 
@@ -4,19 +4,26 @@ from __future__ import annotations
 
 import os
 import sys
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
+from itertools import chain, repeat
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
-from scripts.catalog.config import CatalogConfig, Rule
+from scripts.catalog.config import DATACLASS_SLOTS, CatalogConfig, Rule
 from scripts.catalog.patterns import (
     match_directory_pattern,
     match_filename_pattern,
     match_content_pattern,
     get_confidence_for_match,
+    read_content,
+    search_content,
 )
 from scripts.catalog.ast_analyzer import match_ast_condition
 
+# Files per task when classification is spread over a process pool
+PARALLEL_CHUNK_SIZE = 64
+
 
 @dataclass
 class ClassificationResult:
@@ -27,7 +34,7 @@ class ClassificationResult:
     skipped_files: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FileClassification:
     """Classification result for a single file."""
 
@@ -46,16 +53,16 @@ def _match_rule(
 ) -> bool:
     """Check if a file matches a single rule."""
     if rule.type == "directory" and rule.pattern:
-        return match_directory_pattern(relative_path, rule.pattern)
+        return match_directory_pattern(relative_path, rule.compiled or rule.pattern)
 
     elif rule.type == "filename" and rule.pattern:
-        return match_filename_pattern(file_path, rule.pattern)
+        return match_filename_pattern(file_path, rule.compiled or rule.pattern)
 
     elif rule.type == "content" and rule.pattern:
         return match_content_pattern(
             file_path,
-            rule.pattern,
-            filetypes=rule.filetypes,
+            rule.compiled or rule.pattern,
+            filetypes=rule.filetypes_set,
             max_file_size=config.max_file_size,
         )
 
@@ -66,18 +73,22 @@ def _match_rule(
 
 
 def _get_rule_string(rule: Rule) -> str:
-    """Get a string representation of a rule for matched_rules list."""
-    if rule.type == "ast_content":
-        return f"ast_content:{rule.condition}"
-    return f"{rule.type}:{rule.pattern}"
+    """Get a string representation of a rule for matched_rules list.
+
+    The string is built once per rule (Rule.label), so all files matched by
+    a rule share one object.
+    """
+    return rule.label
+
+
+_CONFIDENCE_ORDER = {"high": 3, "medium": 2, "low": 1}
 
 
 def _get_highest_confidence(confidences: list[str]) -> str:
     """Get the highest confidence level from a list."""
-    order = {"high": 3, "medium": 2, "low": 1}
     if not confidences:
         return "low"
-    return max(confidences, key=lambda c: order.get(c, 0))
+    return max(confidences, key=lambda c: _CONFIDENCE_ORDER.get(c, 0))
 
 
 def classify_file(
@@ -106,10 +117,39 @@ def classify_file(
 
     matched_categories: list[tuple[str, str, str]] = []  # (category, rule_str, confidence)
 
-    # Check each category's rules
-    for category in config.classification.categories:
-        for rule in category.rules:
-            if _match_rule(rule, file_path, relative_path, config):
+    # File content, read on the first content rule and shared by the rest
+    content: Optional[bytes] = None
+    content_read = False
+
+    # Check each category's rules, skipping rules that cannot apply to this extension
+    ext = file_path.suffix.lower()
+    for category, rules in config.classification.rules_for_extension(ext):
+        # All directory (and all filename) rules of a category are tested in
+        # one regex pass, done lazily in case an earlier rule matches first
+        directory_match: Optional[Rule] = None
+        directories_checked = False
+        filename_match: Optional[Rule] = None
+        filenames_checked = False
+        for rule in rules:
+            if rule.type == "directory":
+                if not directories_checked:
+                    directory_match = category.first_directory_match(relative_path)
+                    directories_checked = True
+                matched = rule is directory_match
+            elif rule.type == "filename":
+                if not filenames_checked:
+                    filename_match = category.first_filename_match(file_path.name)
+                    filenames_checked = True
+                matched = rule is filename_match
+            elif rule.type == "content" and rule.pattern:
+                # Filetypes were already checked by rules_for_extension()
+                if not content_read:
+                    content = read_content(file_path, config.max_file_size)
+                    content_read = True
+                matched = content is not None and search_content(content, rule.compiled or rule.pattern)
+            else:
+                matched = _match_rule(rule, file_path, relative_path, config)
+            if matched:
                 rule_str = _get_rule_string(rule)
                 confidence = get_confidence_for_match(rule.type, rule.pattern or rule.condition or "")
                 matched_categories.append((category.name, rule_str, confidence))
@@ -139,45 +179,46 @@ def classify_file(
         matched_rules.append(rule_str)
         confidences.append(conf)
 
-    # Determine primary category using priority order
-    priority_order = config.classification.priority_order
-    if priority_order:
-        # Find the highest priority category among matches
-        for priority_cat in priority_order:
-            if priority_cat in categories:
-                primary = priority_cat
-                break
-        else:
-            # No matching priority category, use first match
-            primary = categories[0]
-    else:
-        primary = categories[0]
-
     return FileClassification(
         file_path=relative_path,
-        primary_category=primary,
+        # Highest-priority match, or the first match if none has a priority
+        primary_category=config.classification.primary_category(categories),
         categories=categories,
         matched_rules=matched_rules,
         confidence=_get_highest_confidence(confidences),
     )
 
 
-def _should_skip_dir(dir_name: str, skip_dirs: list[str]) -> bool:
+def _should_skip_dir(dir_name: str, skip_dirs: frozenset[str]) -> bool:
     """Check if a directory should be skipped."""
     return dir_name in skip_dirs or dir_name.startswith(".")
 
 
-def _should_skip_file(file_path: Path) -> bool:
+def _should_skip_file(filename: str) -> bool:
     """Check if a file should be skipped (e.g., hidden files)."""
-    return file_path.name.startswith(".")
+    return filename.startswith(".")
 
 
-def classify_directory(
+@dataclass
+class DiscoveryResult:
+    """Files found by a directory walk, plus entries skipped along the way."""
+
+    file_paths: list[str]  # Relative to project root
+    skipped_count: int = 0
+    skipped_files: list[str] = field(default_factory=list)
+
+
+def discover_files(
     root_dir: Path | str,
     config: CatalogConfig,
     index_dirs: Optional[list[str]] = None,
-) -> ClassificationResult:
-    """Classify all files in a directory tree.
+) -> DiscoveryResult:
+    """Find all indexable files in a directory tree.
+
+    Skip directories and hidden entries are pruned during the walk, and
+    circular symlinks are detected when following symlinks. The result is
+    shared by classification and dependency analysis so the tree is only
+    walked once per command.
 
     Args:
         root_dir: Project root directory.
@@ -185,12 +226,20 @@ def classify_directory(
         index_dirs: Specific directories to index. If None, uses config.index_dirs.
 
     Returns:
-        ClassificationResult containing classifications and skipped file info.
+        DiscoveryResult with relative file paths and skipped entry info.
     """
-    root_dir = Path(root_dir)
-    results: list[FileClassification] = []
+    root_str = str(root_dir)
+    root_prefix = os.path.join(root_str, "")
+    file_paths: list[str] = []
     skipped_count = 0
     skipped_files: list[str] = []
+    follow_symlinks = config.follow_symlinks
+    skip_dirs = frozenset(config.skip_dirs)
+
+    def relative(path: str) -> str:
+        if path == root_str:
+            return "."
+        return path[len(root_prefix):] if path.startswith(root_prefix) else path
 
     # Track visited inodes to detect circular symlinks
     visited_inodes: set[tuple[int, int]] = set()  # (device, inode) pairs
@@ -200,59 +249,72 @@ def classify_directory(
 
     # If "." is in dirs_to_scan, scan from root
     if "." in dirs_to_scan:
-        scan_roots = [root_dir]
+        scan_roots = [root_str]
     else:
-        scan_roots = [root_dir / d for d in dirs_to_scan if (root_dir / d).exists()]
+        candidates = (os.path.normpath(os.path.join(root_str, d)) for d in dirs_to_scan)
+        scan_roots = [d for d in candidates if os.path.exists(d)]
 
     # If no configured dirs exist, scan from root
     if not scan_roots:
-        scan_roots = [root_dir]
+        scan_roots = [root_str]
 
     for scan_root in scan_roots:
-        for dirpath, dirnames, filenames in os.walk(scan_root, followlinks=config.follow_symlinks):
-            current_dir = Path(dirpath)
+        # Depth-first in the same order as os.walk. Entry types come from the
+        # directory listing, so plain files and directories need no stat call.
+        stack = [scan_root]
+        while stack:
+            dirpath = stack.pop()
+            try:
+                with os.scandir(dirpath) as it:
+                    entries = list(it)
+            except OSError:
+                continue
 
             # Check for circular symlink on the directory itself
-            if config.follow_symlinks:
+            if follow_symlinks:
                 try:
-                    dir_stat = current_dir.stat()
+                    dir_stat = os.stat(dirpath)
                     dir_inode = (dir_stat.st_dev, dir_stat.st_ino)
                     if dir_inode in visited_inodes:
                         # Circular symlink detected - skip this directory
-                        rel_path = str(current_dir.relative_to(root_dir)) if current_dir != root_dir else "."
+                        rel_path = relative(dirpath)
                         print(f"Warning: Circular symlink detected, skipping: {rel_path}", file=sys.stderr)
                         skipped_count += 1
                         skipped_files.append(rel_path)
-                        dirnames[:] = []  # Don't descend into subdirs
                         continue
                     visited_inodes.add(dir_inode)
                 except OSError:
                     pass  # If we can't stat, continue anyway
 
-            # Filter out skip directories (modifying dirnames in place to prevent descent)
-            dirnames[:] = [
-                d for d in dirnames
-                if not _should_skip_dir(d, config.skip_dirs)
-            ]
+            subdirs = []
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
 
-            for filename in filenames:
-                file_path = current_dir / filename
+                if is_dir:
+                    # Skipped directories are never descended into, nor are
+                    # directory symlinks unless following symlinks
+                    if not _should_skip_dir(entry.name, skip_dirs) and (follow_symlinks or not entry.is_symlink()):
+                        subdirs.append(entry.path)
+                    continue
 
                 # Skip hidden files
-                if _should_skip_file(file_path):
+                if _should_skip_file(entry.name):
                     continue
 
-                # Skip symlinks if configured
-                if file_path.is_symlink() and not config.follow_symlinks:
-                    continue
+                if entry.is_symlink():
+                    # Skip symlinks if configured
+                    if not follow_symlinks:
+                        continue
 
-                # Check for circular symlink on files when following symlinks
-                if config.follow_symlinks and file_path.is_symlink():
+                    # Check for circular symlink on files when following symlinks
                     try:
-                        file_stat = file_path.stat()
+                        file_stat = entry.stat()
                         file_inode = (file_stat.st_dev, file_stat.st_ino)
                         if file_inode in visited_inodes:
-                            rel_path = str(file_path.relative_to(root_dir))
+                            rel_path = relative(entry.path)
                             print(f"Warning: Circular symlink detected, skipping: {rel_path}", file=sys.stderr)
                             skipped_count += 1
                             skipped_files.append(rel_path)
@@ -261,19 +323,100 @@ def classify_directory(
                     except OSError:
                         pass  # If we can't stat, try to classify anyway
 
-                try:
-                    result = classify_file(file_path, root_dir, config)
-                    results.append(result)
-                except (IOError, OSError, UnicodeDecodeError, ValueError) as e:
-                    # Graceful degradation - skip files that can't be classified
-                    # IOError/OSError: file access issues
-                    # UnicodeDecodeError: binary or non-UTF-8 files
-                    # ValueError: path resolution issues
-                    rel_path = str(file_path.relative_to(root_dir))
-                    print(f"Warning: Skipping {rel_path}: {e}", file=sys.stderr)
-                    skipped_count += 1
-                    skipped_files.append(rel_path)
-                    continue
+                file_paths.append(relative(entry.path))
+
+            stack.extend(reversed(subdirs))
+
+    return DiscoveryResult(
+        file_paths=file_paths,
+        skipped_count=skipped_count,
+        skipped_files=skipped_files,
+    )
+
+
+def _classify_chunk(
+    root_dir: Path,
+    config: CatalogConfig,
+    file_paths: list[str],
+) -> list[tuple[str, Optional[FileClassification], Optional[str]]]:
+    """Classify a batch of files, capturing per-file errors.
+
+    Runs in worker processes when classification is parallelized, so errors
+    are returned instead of printed.
+
+    Returns:
+        (relative path, classification or None, error message or None) tuples
+        in input order.
+    """
+    outcomes: list[tuple[str, Optional[FileClassification], Optional[str]]] = []
+    for relative_path in file_paths:
+        try:
+            result = classify_file(root_dir / relative_path, root_dir, config)
+            outcomes.append((relative_path, result, None))
+        except (IOError, OSError, UnicodeDecodeError, ValueError) as e:
+            # Graceful degradation - skip files that can't be classified
+            # IOError/OSError: file access issues
+            # UnicodeDecodeError: binary or non-UTF-8 files
+            # ValueError: path resolution issues
+            outcomes.append((relative_path, None, str(e)))
+    return outcomes
+
+
+def classify_directory(
+    root_dir: Path | str,
+    config: CatalogConfig,
+    index_dirs: Optional[list[str]] = None,
+    file_paths: Optional[list[str]] = None,
+    executor: Optional[Executor] = None,
+) -> ClassificationResult:
+    """Classify all files in a directory tree.
+
+    Args:
+        root_dir: Project root directory.
+        config: Catalog configuration.
+        index_dirs: Specific directories to index. If None, uses config.index_dirs.
+        file_paths: Precomputed relative file paths (e.g. from discover_files).
+            If None, the tree is walked with discover_files.
+        executor: Optional process pool to classify files in parallel,
+            in batches of PARALLEL_CHUNK_SIZE. Runs serially if None or if
+            there is only one batch.
+
+    Returns:
+        ClassificationResult containing classifications and skipped file info.
+    """
+    root_dir = Path(root_dir)
+    results: list[FileClassification] = []
+    skipped_count = 0
+    skipped_files: list[str] = []
+
+    if file_paths is None:
+        discovery = discover_files(root_dir, config, index_dirs)
+        file_paths = discovery.file_paths
+        skipped_count = discovery.skipped_count
+        skipped_files = discovery.skipped_files
+
+    # A single batch is cheaper to classify here than to ship to a worker
+    # process, along with the pickled config
+    if executor is None or len(file_paths) <= PARALLEL_CHUNK_SIZE:
+        outcomes: Iterable[tuple[str, Optional[FileClassification], Optional[str]]] = (
+            _classify_chunk(root_dir, config, file_paths)
+        )
+    else:
+        chunks = [
+            file_paths[i:i + PARALLEL_CHUNK_SIZE]
+            for i in range(0, len(file_paths), PARALLEL_CHUNK_SIZE)
+        ]
+        outcomes = chain.from_iterable(
+            executor.map(_classify_chunk, repeat(root_dir), repeat(config), chunks)
+        )
+
+    for relative_path, result, error in outcomes:
+        if result is None:
+            print(f"Warning: Skipping {relative_path}: {error}", file=sys.stderr)
+            skipped_count += 1
+            skipped_files.append(relative_path)
+            continue
+        results.append(result)
 
     return ClassificationResult(
         classifications=results,
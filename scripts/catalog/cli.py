@@ -3,41 +3,36 @@
 from __future__ import annotations
 
 import argparse
-import json
+import contextlib
+import functools
 import os
 import shutil
 import sys
+from collections import Counter
 from datetime import datetime, timezone
 from enum import IntEnum
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
 from scripts.catalog.config import (
     load_config,
     ConfigError,
     CatalogConfig,
     DEFAULT_CONFIG_PATH,
+    DEFAULT_CACHE_DIR,
+    DEFAULT_CONFIG_CACHE_PATH,
     DEFAULT_STATE_PATH,
     TEMPLATE_CONFIG_PATH,
 )
-from scripts.catalog.classifier import classify_directory, FileClassification, ClassificationResult
-from scripts.catalog.dependencies import build_dependency_graph, ModuleDependencies
-from scripts.catalog.query import (
-    load_classification_index,
-    load_dependencies_index,
-    query_by_category,
-    query_by_file,
-    query_depends_on,
-    query_imports,
-    get_summary,
-)
-from scripts.catalog.incremental import (
-    load_state,
-    save_state,
-    get_changed_files,
-    update_state_hashes,
-    CatalogState,
-)
+from scripts.catalog.serialization import dump_file, dumps_str, load_sidecar, write_sidecar
+
+# Subcommand modules are imported inside each cmd_* function so that cheap
+# commands (init, status, query) don't pay for loading the analysis code.
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+    from scripts.catalog.classifier import FileClassification
+    from scripts.catalog.dependencies import ModuleDependencies
 
 
 class ExitCode(IntEnum):
@@ -58,20 +53,21 @@ def _get_config(config_path: Optional[str]) -> CatalogConfig:
     3. catalog.yaml (legacy fallback)
     4. Built-in defaults
     """
+    cache_path = Path.cwd() / DEFAULT_CONFIG_CACHE_PATH
     if config_path:
-        return load_config(config_path)
+        return load_config(config_path, cache_path)
 
     # Try new default location first
     default_path = Path.cwd() / DEFAULT_CONFIG_PATH
     if default_path.exists():
-        return load_config(default_path)
+        return load_config(default_path, cache_path)
 
     # Legacy fallback
     legacy_path = Path.cwd() / "catalog.yaml"
     if legacy_path.exists():
-        return load_config(legacy_path)
+        return load_config(legacy_path, cache_path)
 
-    return load_config(default_path)  # Will return defaults
+    return load_config(default_path, cache_path)  # Will return defaults
 
 
 def _get_state_path(root: Path) -> Path:
@@ -81,6 +77,13 @@ def _get_state_path(root: Path) -> Path:
     return state_path
 
 
+def _get_cache_dir(root: Path) -> Path:
+    """Get the cache directory holding index sidecars, ensuring it exists."""
+    cache_dir = root / DEFAULT_CACHE_DIR
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
 def _ensure_output_dir(config: CatalogConfig, root: Path) -> Path:
     """Ensure output directory exists and return its path.
 
@@ -96,29 +99,116 @@ def _ensure_output_dir(config: CatalogConfig, root: Path) -> Path:
     return output_dir
 
 
+def _same_index_content(a: dict, b: dict) -> bool:
+    """Check if two indexes are equal, ignoring their generated timestamps."""
+    return a.keys() == b.keys() and all(a[k] == b[k] for k in a if k != "generated")
+
+
+def _is_indented_json(path: Path) -> bool:
+    """Check if a JSON file was written pretty-printed (vs compact)."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(2) == b"{\n"
+    except OSError:
+        return False
+
+
+def _current_generated(path: Path, index: dict, sidecar_dir: Path, indent: bool) -> Optional[str]:
+    """Return the generated timestamp of the index on disk, if it is current.
+
+    The index on disk is current when its up-to-date sidecar shows the same
+    content as ``index`` apart from the generated timestamp, and the file
+    uses the requested layout.
+    """
+    existing = load_sidecar(path, sidecar_dir)
+    if (
+        isinstance(existing, dict)
+        and _same_index_content(existing, index)
+        and _is_indented_json(path) == indent
+    ):
+        return existing.get("generated")
+    return None
+
+
+def _dump_index(path: Path, index: dict, sidecar_dir: Path, indent: bool = True) -> None:
+    """Write an index as JSON, followed by its binary sidecar."""
+    dump_file(path, index, indent=indent)
+    write_sidecar(path, sidecar_dir, index)
+
+
+def _write_index(path: Path, index: dict, sidecar_dir: Path, indent: bool = True) -> bool:
+    """Write an index as JSON, followed by its binary sidecar, unless current.
+
+    Nothing is written when the index on disk is current (see
+    _current_generated). The existing timestamp is then carried over into
+    ``index``.
+
+    Args:
+        path: Destination JSON file.
+        index: Index data to write.
+        sidecar_dir: Directory for the binary sidecar.
+        indent: If True, pretty-print; otherwise write compact JSON.
+
+    Returns:
+        True if the index was written, False if it was already current.
+    """
+    generated = _current_generated(path, index, sidecar_dir, indent)
+    if generated is not None:
+        index["generated"] = generated
+        return False
+
+    _dump_index(path, index, sidecar_dir, indent)
+    return True
+
+
+@contextlib.contextmanager
+def _process_pool(jobs: int) -> Iterator[Optional[ProcessPoolExecutor]]:
+    """Yield a process pool for parallel builds, or None to run serially.
+
+    Args:
+        jobs: Number of worker processes. 1 runs serially, 0 uses all CPUs.
+    """
+    if jobs == 1:
+        yield None
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs or None) as pool:
+        yield pool
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string."""
+    return datetime.now(timezone.utc).isoformat()
+
+
 def _build_classification_index(
     classifications: list[FileClassification],
+    generated: Optional[str] = None,
 ) -> dict:
-    """Build the classification index structure."""
-    by_category: dict[str, int] = {}
-    files: dict[str, dict] = {}
+    """Build the classification index structure.
 
-    for c in classifications:
-        files[c.file_path] = {
+    Args:
+        classifications: Classified files.
+        generated: Timestamp to record. Defaults to the current UTC time.
+    """
+    files: dict[str, dict] = {
+        c.file_path: {
             "primary_category": c.primary_category,
             "categories": c.categories,
             "matched_rules": c.matched_rules,
             "confidence": c.confidence,
         }
+        for c in classifications
+    }
 
-        # Count by primary category
-        if c.primary_category not in by_category:
-            by_category[c.primary_category] = 0
-        by_category[c.primary_category] += 1
+    # Count by primary category
+    by_category = dict(Counter(c.primary_category for c in classifications))
 
     return {
         "schema_version": "1.0",
-        "generated": datetime.now(timezone.utc).isoformat(),
+        "generated": generated or _utc_timestamp(),
         "file_count": len(files),
         "by_category": by_category,
         "files": files,
@@ -127,20 +217,26 @@ def _build_classification_index(
 
 def _build_dependencies_index(
     graph: dict[str, ModuleDependencies],
+    generated: Optional[str] = None,
 ) -> dict:
-    """Build the dependencies index structure."""
-    modules: dict[str, dict] = {}
+    """Build the dependencies index structure.
 
-    for file_path, deps in graph.items():
-        modules[file_path] = {
+    Args:
+        graph: Dependency graph keyed by file path.
+        generated: Timestamp to record. Defaults to the current UTC time.
+    """
+    modules: dict[str, dict] = {
+        file_path: {
             "imports": deps.imports,
             "imported_by": deps.imported_by,
             "external": deps.external,
         }
+        for file_path, deps in graph.items()
+    }
 
     return {
         "schema_version": "1.0",
-        "generated": datetime.now(timezone.utc).isoformat(),
+        "generated": generated or _utc_timestamp(),
         "module_count": len(modules),
         "modules": modules,
     }
@@ -148,15 +244,28 @@ def _build_dependencies_index(
 
 def cmd_build(args: argparse.Namespace) -> int:
     """Build complete catalog (classification + dependencies)."""
+    from scripts.catalog.classifier import classify_directory
+    from scripts.catalog.dependencies import build_dependency_graph
+    from scripts.catalog.incremental import (
+        CatalogState,
+        compute_file_hashes,
+        get_changed_files,
+        load_state,
+        save_state,
+        stat_files,
+        update_state_hashes,
+    )
+
     try:
         config = _get_config(args.config)
     except ConfigError as e:
-        print(json.dumps(e.to_json()), file=sys.stderr)
+        print(dumps_str(e.to_json(), indent=False), file=sys.stderr)
         return ExitCode.CONFIG_ERROR
 
     root = Path.cwd()
     output_dir = _ensure_output_dir(config, root)
     state_path = _get_state_path(root)
+    cache_dir = _get_cache_dir(root)
     incremental = getattr(args, "incremental", False)
 
     if incremental:
@@ -166,48 +275,78 @@ def cmd_build(args: argparse.Namespace) -> int:
         print("Building catalog...")
         state = CatalogState()
 
-    # Step 1: Classification
-    print("  Classifying files...")
-    class_result = classify_directory(root, config)
-    classifications = class_result.classifications
-    skipped_count = class_result.skipped_count
-
-    # Check for changes if incremental mode
-    if incremental and state.file_hashes:
-        all_files = [c.file_path for c in classifications]
-        changed = get_changed_files(root, all_files, state)
-        if not changed:
-            print("  No files changed since last build, skipping rebuild")
-            # Still update state timestamps and return
-            update_state_hashes(root, all_files, state)
-            save_state(state, state_path)
-            if skipped_count > 0:
-                return ExitCode.PARTIAL_SUCCESS
-            return ExitCode.SUCCESS
-        print(f"  {len(changed)} files changed since last build")
-
-    class_index = _build_classification_index(classifications)
-
-    class_path = output_dir / config.output.classification_file
-    class_path.write_text(json.dumps(class_index, indent=2))
-    print(f"  Classified {class_index['file_count']} files")
-    if skipped_count > 0:
-        print(f"  Skipped {skipped_count} files due to errors")
-
-    # Step 2: Dependencies
-    print("  Analyzing dependencies...")
-    python_files = [c.file_path for c in classifications if c.file_path.endswith(".py")]
-    graph = build_dependency_graph(root, python_files)
-    deps_index = _build_dependencies_index(graph)
-
-    deps_path = output_dir / config.output.dependencies_file
-    deps_path.write_text(json.dumps(deps_index, indent=2))
-    print(f"  Analyzed {deps_index['module_count']} Python modules")
-
-    # Save state for incremental builds
-    all_files = [c.file_path for c in classifications]
-    update_state_hashes(root, all_files, state)
-    save_state(state, state_path)
+    with _process_pool(getattr(args, "jobs", 1)) as pool:
+        # Step 1: Classification
+        print("  Classifying files...")
+        class_result = classify_directory(root, config, executor=pool)
+        classifications = class_result.classifications
+        skipped_count = class_result.skipped_count
+
+        # Collect all files and Python files in one pass over the results
+        all_files: list[str] = []
+        python_files: list[str] = []
+        for c in classifications:
+            file_path = c.file_path
+            all_files.append(file_path)
+            if file_path.endswith(".py"):
+                python_files.append(file_path)
+
+        # Check for changes if incremental mode
+        file_meta = stat_files(root, all_files)
+        hashes = compute_file_hashes(root, all_files, state, file_meta)
+        import_cache: dict[str, list[str]] = {}
+        if incremental and state.file_hashes:
+            changed = get_changed_files(root, all_files, state, hashes)
+            if not changed:
+                print("  No files changed since last build, skipping rebuild")
+                # Still update state timestamps and return
+                update_state_hashes(root, all_files, state, hashes, file_meta)
+                save_state(state, state_path)
+                if skipped_count > 0:
+                    return ExitCode.PARTIAL_SUCCESS
+                return ExitCode.SUCCESS
+            print(f"  {len(changed)} files changed since last build")
+
+            # Reuse the parsed imports of Python files that did not change
+            for file_path in python_files:
+                imports = state.file_imports.get(file_path)
+                current_hash = hashes.get(file_path)
+                if imports is None or current_hash is None:
+                    continue
+                if current_hash == state.file_hashes.get(file_path):
+                    import_cache[file_path] = imports
+
+        # One timestamp for both indexes produced by this build
+        generated = _utc_timestamp()
+        class_index = _build_classification_index(classifications, generated)
+
+        print(f"  Classified {class_index['file_count']} files")
+        if skipped_count > 0:
+            print(f"  Skipped {skipped_count} files due to errors")
+
+        # Step 2: Dependencies
+        print("  Analyzing dependencies...")
+        graph = build_dependency_graph(root, python_files, executor=pool, import_cache=import_cache)
+        deps_index = _build_dependencies_index(graph, generated)
+
+        print(f"  Analyzed {deps_index['module_count']} Python modules")
+
+        # Both indexes are rewritten if either changed, so the pair keeps one
+        # timestamp: that of the last build that changed the catalog
+        class_path = output_dir / config.output.classification_file
+        deps_path = output_dir / config.output.dependencies_file
+        indent = not getattr(args, "compact", False)
+        class_generated = _current_generated(class_path, class_index, cache_dir, indent)
+        if class_generated is None or class_generated != _current_generated(
+            deps_path, deps_index, cache_dir, indent
+        ):
+            _dump_index(class_path, class_index, cache_dir, indent)
+            _dump_index(deps_path, deps_index, cache_dir, indent)
+
+        # Save state for incremental builds
+        state.file_imports = import_cache
+        update_state_hashes(root, all_files, state, hashes, file_meta)
+        save_state(state, state_path)
 
     print(f"Output: {output_dir}")
 
@@ -219,23 +358,27 @@ def cmd_build(args: argparse.Namespace) -> int:
 
 def cmd_classify(args: argparse.Namespace) -> int:
     """Run classification only."""
+    from scripts.catalog.classifier import classify_directory
+
     try:
         config = _get_config(args.config)
     except ConfigError as e:
-        print(json.dumps(e.to_json()), file=sys.stderr)
+        print(dumps_str(e.to_json(), indent=False), file=sys.stderr)
         return ExitCode.CONFIG_ERROR
 
     root = Path.cwd()
     output_dir = _ensure_output_dir(config, root)
+    cache_dir = _get_cache_dir(root)
 
     print("Classifying files...")
-    class_result = classify_directory(root, config)
+    with _process_pool(getattr(args, "jobs", 1)) as pool:
+        class_result = classify_directory(root, config, executor=pool)
     classifications = class_result.classifications
     skipped_count = class_result.skipped_count
     class_index = _build_classification_index(classifications)
 
     class_path = output_dir / config.output.classification_file
-    class_path.write_text(json.dumps(class_index, indent=2))
+    _write_index(class_path, class_index, cache_dir, indent=not getattr(args, "compact", False))
 
     print(f"Classified {class_index['file_count']} files")
     if skipped_count > 0:
@@ -250,46 +393,31 @@ def cmd_classify(args: argparse.Namespace) -> int:
 
 def cmd_deps(args: argparse.Namespace) -> int:
     """Run dependency analysis only."""
+    from scripts.catalog.classifier import discover_files
+    from scripts.catalog.dependencies import build_dependency_graph
+
     try:
         config = _get_config(args.config)
     except ConfigError as e:
-        print(json.dumps(e.to_json()), file=sys.stderr)
+        print(dumps_str(e.to_json(), indent=False), file=sys.stderr)
         return ExitCode.CONFIG_ERROR
 
     root = Path.cwd()
     output_dir = _ensure_output_dir(config, root)
+    cache_dir = _get_cache_dir(root)
 
     print("Analyzing dependencies...")
 
-    # Find all Python files
-    python_files = []
-
-    # Determine directories to scan
-    if "." in config.index_dirs:
-        scan_roots = [root]
-    else:
-        scan_roots = [root / d for d in config.index_dirs if (root / d).exists()]
+    # Find all Python files, using the same walk as classification
+    discovery = discover_files(root, config)
+    python_files = [p for p in discovery.file_paths if p.endswith(".py")]
 
-    # Fallback to project root if no configured dirs exist
-    if not scan_roots:
-        scan_roots = [root]
-
-    for scan_root in scan_roots:
-        for py_file in scan_root.rglob("*.py"):
-            try:
-                relative = str(py_file.relative_to(root))
-                # Skip files in skip_dirs (use path component matching, not substring)
-                path_parts = Path(relative).parts
-                if not any(skip in path_parts for skip in config.skip_dirs):
-                    python_files.append(relative)
-            except ValueError:
-                continue
-
-    graph = build_dependency_graph(root, python_files)
+    with _process_pool(getattr(args, "jobs", 1)) as pool:
+        graph = build_dependency_graph(root, python_files, executor=pool)
     deps_index = _build_dependencies_index(graph)
 
     deps_path = output_dir / config.output.dependencies_file
-    deps_path.write_text(json.dumps(deps_index, indent=2))
+    _write_index(deps_path, deps_index, cache_dir, indent=not getattr(args, "compact", False))
 
     print(f"Analyzed {deps_index['module_count']} Python modules")
     print(f"Output: {deps_path}")
@@ -298,33 +426,44 @@ def cmd_deps(args: argparse.Namespace) -> int:
 
 def cmd_query(args: argparse.Namespace) -> int:
     """Query the catalog."""
+    from scripts.catalog.query import (
+        get_summary,
+        load_classification_index_shared,
+        load_dependencies_index_shared,
+        query_by_category,
+        query_by_file,
+        query_depends_on,
+        query_imports,
+    )
+
     try:
         config = _get_config(args.config)
     except ConfigError as e:
-        print(json.dumps(e.to_json()), file=sys.stderr)
+        print(dumps_str(e.to_json(), indent=False), file=sys.stderr)
         return ExitCode.CONFIG_ERROR
 
     root = Path.cwd()
     output_dir = root / config.output.index_dir
+    cache_dir = root / DEFAULT_CACHE_DIR
 
     if args.file:
         # Query specific file
         class_path = output_dir / config.output.classification_file
-        index = load_classification_index(class_path)
+        index = load_classification_index_shared(class_path, cache_dir)
         if index is None:
             print("Classification index not found. Run 'catalog build' first.")
             return ExitCode.FILE_SYSTEM_ERROR
 
         result = query_by_file(index, args.file)
         if result:
-            print(json.dumps(result, indent=2))
+            print(dumps_str(result))
         else:
             print(f"File not found: {args.file}")
 
     elif args.category:
         # Query by category
         class_path = output_dir / config.output.classification_file
-        index = load_classification_index(class_path)
+        index = load_classification_index_shared(class_path, cache_dir)
         if index is None:
             print("Classification index not found. Run 'catalog build' first.")
             return ExitCode.FILE_SYSTEM_ERROR
@@ -336,7 +475,7 @@ def cmd_query(args: argparse.Namespace) -> int:
     elif args.depends_on:
         # Query reverse dependencies
         deps_path = output_dir / config.output.dependencies_file
-        index = load_dependencies_index(deps_path)
+        index = load_dependencies_index_shared(deps_path, cache_dir)
         if index is None:
             print("Dependencies index not found. Run 'catalog build' first.")
             return ExitCode.FILE_SYSTEM_ERROR
@@ -351,7 +490,7 @@ def cmd_query(args: argparse.Namespace) -> int:
     elif getattr(args, "imports", None):
         # Query forward dependencies (what does this file import?)
         deps_path = output_dir / config.output.dependencies_file
-        index = load_dependencies_index(deps_path)
+        index = load_dependencies_index_shared(deps_path, cache_dir)
         if index is None:
             print("Dependencies index not found. Run 'catalog build' first.")
             return ExitCode.FILE_SYSTEM_ERROR
@@ -370,13 +509,13 @@ def cmd_query(args: argparse.Namespace) -> int:
     elif getattr(args, "summary", False):
         # Summary statistics
         class_path = output_dir / config.output.classification_file
-        index = load_classification_index(class_path)
+        index = load_classification_index_shared(class_path, cache_dir)
         if index is None:
             print("Classification index not found. Run 'catalog build' first.")
             return ExitCode.FILE_SYSTEM_ERROR
 
         summary = get_summary(index)
-        print(json.dumps(summary, indent=2))
+        print(dumps_str(summary))
 
     else:
         print("Please specify --file, --category, --imports, --depends-on, or --summary")
@@ -387,21 +526,28 @@ def cmd_query(args: argparse.Namespace) -> int:
 
 def cmd_status(args: argparse.Namespace) -> int:
     """Show catalog status."""
+    from scripts.catalog.query import (
+        get_summary,
+        load_classification_index_shared,
+        load_dependencies_index_shared,
+    )
+
     try:
         config = _get_config(args.config)
     except ConfigError as e:
-        print(json.dumps(e.to_json()), file=sys.stderr)
+        print(dumps_str(e.to_json(), indent=False), file=sys.stderr)
         return ExitCode.CONFIG_ERROR
 
     root = Path.cwd()
     output_dir = root / config.output.index_dir
+    cache_dir = root / DEFAULT_CACHE_DIR
 
     print("Catalog Status")
     print("=" * 40)
 
     # Check classification index
     class_path = output_dir / config.output.classification_file
-    class_index = load_classification_index(class_path)
+    class_index = load_classification_index_shared(class_path, cache_dir)
 
     if class_index:
         summary = get_summary(class_index)
@@ -417,7 +563,7 @@ def cmd_status(args: argparse.Namespace) -> int:
 
     # Check dependencies index
     deps_path = output_dir / config.output.dependencies_file
-    deps_index = load_dependencies_index(deps_path)
+    deps_index = load_dependencies_index_shared(deps_path, cache_dir)
 
     if deps_index:
         print(f"\nDependencies Index: {deps_path}")
@@ -442,45 +588,49 @@ def _find_template_path() -> Optional[Path]:
     3. .claude directory in current working directory
     4. Home directory .claude installation
 
+    The search stops at the first hit and is cached per process for each
+    combination of CLAUDE_PLUGIN_ROOT and working directory.
+
     Returns:
         Path to template if found, None otherwise.
     """
-    template_rel = TEMPLATE_CONFIG_PATH  # "templates/catalog/catalog.yaml.template"
-
-    # List of potential plugin root directories to check
-    candidates: list[Path] = []
-
-    # 1. Environment variable (explicit override)
-    env_root = os.environ.get("CLAUDE_PLUGIN_ROOT")
-    if env_root:
-        candidates.append(Path(env_root))
-
-    # 2. Relative to this script (scripts/catalog/cli.py -> plugin root)
-    #    Handles: plugin_root/scripts/catalog/cli.py
-    script_path = Path(__file__).resolve()
-    candidates.append(script_path.parent.parent.parent)
+    return _find_template_path_cached(os.environ.get("CLAUDE_PLUGIN_ROOT"), Path.cwd())
 
-    # 3. Current working directory's .claude folder (plugin installed there)
-    candidates.append(Path.cwd() / ".claude")
 
-    # 4. Home directory .claude installation
-    candidates.append(Path.home() / ".claude")
-
-    # 5. Walk up from script to find templates/ directory
-    current = script_path.parent
-    for _ in range(5):  # Max 5 levels up
-        if (current / "templates").is_dir():
-            candidates.append(current)
-            break
-        current = current.parent
-
-    # Check each candidate
-    for candidate in candidates:
-        template_path = candidate / template_rel
-        if template_path.exists():
-            return template_path
+@functools.lru_cache(maxsize=None)
+def _find_template_path_cached(env_root: Optional[str], cwd: Path) -> Optional[Path]:
+    """Search template candidates for a given plugin root override and cwd."""
+    template_rel = TEMPLATE_CONFIG_PATH  # "templates/catalog/catalog.yaml.template"
 
-    return None
+    def candidates() -> Iterator[Path]:
+        """Yield potential plugin root directories, most specific first."""
+        # 1. Environment variable (explicit override)
+        if env_root:
+            yield Path(env_root)
+
+        # 2. Relative to this script (scripts/catalog/cli.py -> plugin root)
+        #    Handles: plugin_root/scripts/catalog/cli.py
+        script_path = Path(__file__).resolve()
+        yield script_path.parent.parent.parent
+
+        # 3. Current working directory's .claude folder (plugin installed there)
+        yield cwd / ".claude"
+
+        # 4. Home directory .claude installation
+        yield Path.home() / ".claude"
+
+        # 5. Walk up from script to find templates/ directory
+        current = script_path.parent
+        for _ in range(5):  # Max 5 levels up
+            if (current / "templates").is_dir():
+                yield current
+                break
+            current = current.parent
+
+    return next(
+        (c / template_rel for c in candidates() if (c / template_rel).exists()),
+        None,
+    )
 
 
 def cmd_init(_args: argparse.Namespace) -> int:
@@ -575,6 +725,44 @@ def _add_config_arg(parser: argparse.ArgumentParser) -> None:
     )
 
 
+def _non_negative_int(value: str) -> int:
+    """Parse a non-negative integer command-line value."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {number}")
+    return number
+
+
+def _add_format_args(parser: argparse.ArgumentParser) -> None:
+    """Add mutually exclusive --compact/--pretty index format arguments."""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write indexes as compact JSON without whitespace (for machine consumers)",
+    )
+    group.add_argument(
+        "--pretty",
+        dest="compact",
+        action="store_false",
+        help="Write indexes as indented JSON (default)",
+    )
+
+
+def _add_jobs_arg(parser: argparse.ArgumentParser) -> None:
+    """Add --jobs argument to a parser."""
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=_non_negative_int,
+        default=1,
+        help="Worker processes for file analysis (default: 1, 0 = all CPUs)",
+    )
+
+
 def main(argv: Optional[list[str]] = None) -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -596,6 +784,8 @@ def main(argv: Optional[list[str]] = None) -> int:
         help="Build complete catalog (classification + dependencies)",
     )
     _add_config_arg(build_parser)
+    _add_jobs_arg(build_parser)
+    _add_format_args(build_parser)
     build_parser.add_argument(
         "--incremental",
         action="store_true",
@@ -608,6 +798,8 @@ def main(argv: Optional[list[str]] = None) -> int:
         help="Run classification only",
     )
     _add_config_arg(classify_parser)
+    _add_jobs_arg(classify_parser)
+    _add_format_args(classify_parser)
 
     # deps command
     deps_parser = subparsers.add_parser(
@@ -615,6 +807,8 @@ def main(argv: Optional[list[str]] = None) -> int:
         help="Run dependency analysis only",
     )
     _add_config_arg(deps_parser)
+    _add_jobs_arg(deps_parser)
+    _add_format_args(deps_parser)
 
     # query command
     query_parser = subparsers.add_parser(
@@ -2,13 +2,31 @@
 
 from __future__ import annotations
 
+import functools
+import json
+import os
 import re
+import sys
 from dataclasses import dataclass, field
 from fnmatch import translate as glob_translate
 from pathlib import Path
 from typing import Any, Optional
 
-import yaml
+from scripts.catalog.patterns import (
+    compile_content_pattern,
+    compile_directory_alternation,
+    compile_directory_pattern,
+    compile_filename_alternation,
+    compile_filename_pattern,
+    directory_alternation_index,
+    match_directory_pattern,
+)
+from scripts.catalog.serialization import atomic_write_bytes, dumps
+
+
+# Keyword arguments for @dataclass on per-item classes: __slots__ drops the
+# per-instance __dict__ where supported (Python 3.10+)
+DATACLASS_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class ConfigError(Exception):
@@ -48,7 +66,7 @@ class ConfigError(Exception):
         return " | ".join(parts)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Rule:
     """A classification rule."""
 
@@ -56,24 +74,111 @@ class Rule:
     pattern: Optional[str] = None
     condition: Optional[str] = None  # for ast_content
     filetypes: Optional[list[str]] = None  # for content patterns
+    # Precompiled pattern, set by validate_config()
+    compiled: Optional[re.Pattern[str]] = field(default=None, repr=False, compare=False)
+    # Lowercased filetypes for O(1) extension checks
+    filetypes_set: Optional[frozenset[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # "type:pattern" label recorded in matched_rules, shared by every match
+    label: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.filetypes is not None:
+            self.filetypes_set = frozenset(ft.lower() for ft in self.filetypes)
+        detail = self.condition if self.type == "ast_content" else self.pattern
+        self.label = sys.intern(f"{self.type}:{detail}")
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Category:
     """A classification category."""
 
     name: str
     rules: list[Rule] = field(default_factory=list)
+    _directory_rules: Optional[list[Rule]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _directory_regex: Optional[re.Pattern[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _filename_rules: Optional[list[Rule]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _filename_regex: Optional[re.Pattern[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def first_directory_match(self, file_path: str) -> Optional[Rule]:
+        """Return the first directory rule matching a relative file path.
+
+        All directory patterns of the category are compiled into a single
+        regex on first use, so each path is tested once per category rather
+        than once per rule.
+
+        Args:
+            file_path: File path relative to the project root.
+
+        Returns:
+            The earliest matching directory rule in rule order, or None.
+        """
+        if self._directory_rules is None:
+            self._directory_rules = [r for r in self.rules if r.type == "directory" and r.pattern]
+            self._directory_regex = compile_directory_alternation(
+                [r.pattern for r in self._directory_rules if r.pattern]
+            )
+        if not self._directory_rules:
+            return None
+
+        if self._directory_regex is None:
+            # Some pattern failed to compile; match rule by rule
+            for rule in self._directory_rules:
+                if match_directory_pattern(file_path, rule.compiled or rule.pattern or ""):
+                    return rule
+            return None
+
+        m = self._directory_regex.match(file_path.lstrip("./"))
+        if m is None or m.lastgroup is None:
+            return None
+        return self._directory_rules[directory_alternation_index(m)]
+
+    def first_filename_match(self, file_name: str) -> Optional[Rule]:
+        """Return the first filename rule matching a file name.
+
+        All filename patterns of the category are compiled into a single
+        regex on first use, so each name is tested once per category rather
+        than once per rule.
+
+        Args:
+            file_name: The file's base name.
+
+        Returns:
+            The earliest matching filename rule in rule order, or None.
+        """
+        if self._filename_rules is None:
+            self._filename_rules = [r for r in self.rules if r.type == "filename" and r.pattern]
+            self._filename_regex = compile_filename_alternation(
+                [r.pattern for r in self._filename_rules if r.pattern]
+            )
+        if not self._filename_rules or self._filename_regex is None:
+            return None
+
+        m = self._filename_regex.match(os.path.normcase(file_name))
+        if m is None or m.lastgroup is None:
+            return None
+        return self._filename_rules[directory_alternation_index(m)]
 
 
 # Default paths for catalog system
 DEFAULT_CONFIG_PATH = ".claude/catalog/config.yaml"
 DEFAULT_INDEX_DIR = ".claude/catalog/indexes"
+DEFAULT_CACHE_DIR = ".claude/cache"
 DEFAULT_STATE_PATH = ".claude/cache/catalog-state.json"
+DEFAULT_CONFIG_CACHE_PATH = ".claude/cache/catalog-config.json"
 TEMPLATE_CONFIG_PATH = "templates/catalog/catalog.yaml.template"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class OutputConfig:
     """Output configuration."""
 
@@ -82,16 +187,81 @@ class OutputConfig:
     dependencies_file: str = "module_dependencies.json"
 
 
-@dataclass
+def _rule_accepts_extension(rule: Rule, ext: str) -> bool:
+    """Check if a rule can possibly match a file with the given extension.
+
+    Directory and filename rules ignore the extension. AST rules only apply
+    to Python files, and content rules honour their optional filetypes filter.
+    """
+    if rule.type == "ast_content":
+        return ext == ".py"
+    if rule.type == "content" and rule.filetypes_set is not None:
+        return ext in rule.filetypes_set
+    return True
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ClassificationConfig:
     """Classification configuration."""
 
     categories: list[Category] = field(default_factory=list)
     default_category: str = "uncategorized"
     priority_order: list[str] = field(default_factory=list)
+    _rules_by_extension: dict[str, list[tuple[Category, list[Rule]]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _priority_index: Optional[dict[str, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-
-@dataclass
+    def primary_category(self, categories: list[str]) -> str:
+        """Pick the primary category among matched categories.
+
+        The matched category listed earliest in priority_order wins; if none
+        is listed, the first matched category does. Priority ranks are
+        computed once and cached.
+
+        Args:
+            categories: Non-empty list of matched category names, in match order.
+
+        Returns:
+            The primary category name.
+        """
+        if self._priority_index is None:
+            index: dict[str, int] = {}
+            for rank, name in enumerate(self.priority_order):
+                index.setdefault(name, rank)
+            self._priority_index = index
+        ranked = [c for c in categories if c in self._priority_index]
+        if not ranked:
+            return categories[0]
+        return min(ranked, key=self._priority_index.__getitem__)
+
+    def rules_for_extension(self, ext: str) -> list[tuple[Category, list[Rule]]]:
+        """Return (category, candidate rules) pairs for a file extension.
+
+        Rules that cannot match files with this extension are dropped, as are
+        categories left without any rules. Rule order within each category is
+        preserved. The result is computed once per extension and cached.
+
+        Args:
+            ext: Lowercased file suffix including the dot (e.g. ".py"), or "".
+
+        Returns:
+            Candidate rules grouped by category, in category order.
+        """
+        candidates = self._rules_by_extension.get(ext)
+        if candidates is None:
+            candidates = []
+            for category in self.categories:
+                rules = [r for r in category.rules if _rule_accepts_extension(r, ext)]
+                if rules:
+                    candidates.append((category, rules))
+            self._rules_by_extension[ext] = candidates
+        return candidates
+
+
+@dataclass(**DATACLASS_SLOTS)
 class CatalogConfig:
     """Complete catalog configuration."""
 
@@ -163,10 +333,10 @@ def _parse_classification(
     )
 
 
-def _validate_regex(pattern: str, config_file: Optional[str] = None) -> None:
-    """Validate a regex pattern."""
+def _validate_regex(pattern: str, config_file: Optional[str] = None) -> re.Pattern[str]:
+    """Validate a regex pattern and return it compiled."""
     try:
-        re.compile(pattern)
+        return compile_content_pattern(pattern)
     except re.error as e:
         raise ConfigError(
             f"Invalid regex pattern '{pattern}': {e}",
@@ -248,15 +418,22 @@ def _validate_ast_condition(condition: str, config_file: Optional[str] = None) -
 def validate_config(config: CatalogConfig, config_file: Optional[str] = None) -> None:
     """Validate configuration values.
 
+    Rule patterns are compiled as they are validated and stored on each
+    rule's ``compiled`` field for the matchers to reuse.
+
     Raises:
         ConfigError: If configuration is invalid.
     """
     for category in config.classification.categories:
         for rule in category.rules:
             if rule.type == "content" and rule.pattern:
-                _validate_regex(rule.pattern, config_file)
+                rule.compiled = _validate_regex(rule.pattern, config_file)
             elif rule.type in ("directory", "filename") and rule.pattern:
                 _validate_glob(rule.pattern, config_file)
+                if rule.type == "filename":
+                    rule.compiled = compile_filename_pattern(rule.pattern)
+                else:
+                    rule.compiled = compile_directory_pattern(rule.pattern)
             elif rule.type == "ast_content":
                 if not rule.condition:
                     raise ConfigError(
@@ -267,11 +444,20 @@ def validate_config(config: CatalogConfig, config_file: Optional[str] = None) ->
                 _validate_ast_condition(rule.condition, config_file)
 
 
-def load_config(config_path: Path | str) -> CatalogConfig:
+def load_config(config_path: Path | str, cache_path: Path | str | None = None) -> CatalogConfig:
     """Load configuration from a YAML file.
 
+    Parsed configs are cached per process, keyed on the file's absolute path,
+    modification time, and size, so repeated loads of an unchanged file skip
+    YAML parsing and validation. Callers must treat the returned config as
+    read-only since it may be shared.
+
+    When cache_path is given, the parsed YAML is also stored there as JSON
+    under the same key, so later runs can skip YAML parsing entirely.
+
     Args:
         config_path: Path to the catalog.yaml file.
+        cache_path: Optional path of the JSON cache for the parsed YAML.
 
     Returns:
         CatalogConfig with loaded values merged with defaults.
@@ -280,22 +466,92 @@ def load_config(config_path: Path | str) -> CatalogConfig:
         ConfigError: If the file exists but contains invalid configuration.
     """
     config_path = Path(config_path)
-    config_file = str(config_path)
 
-    # Start with defaults
-    defaults = get_default_config()
+    try:
+        st = config_path.stat()
+    except OSError:
+        return get_default_config()
+
+    return _load_config_cached(
+        str(config_path.absolute()),
+        st.st_mtime_ns,
+        st.st_size,
+        str(config_path),
+        str(cache_path) if cache_path is not None else None,
+    )
+
+
+def load_config_dict(data: dict[str, Any]) -> CatalogConfig:
+    """Build a configuration from already-parsed config data.
+
+    Takes the same structure as catalog.yaml, for callers that build or
+    parse the config themselves. The result is validated like a loaded
+    file, but not cached.
+
+    Args:
+        data: Config mapping, as parsed from catalog.yaml.
+
+    Returns:
+        CatalogConfig with the given values merged with defaults.
+
+    Raises:
+        ConfigError: If the data is not a mapping or is invalid.
+    """
+    if not isinstance(data, dict):
+        raise ConfigError(
+            "Top-level catalog config must be a mapping",
+            error_type="config_invalid",
+        )
+    if not data:
+        # Same as an empty catalog.yaml
+        return get_default_config()
+    return _config_from_data(data)
 
-    if not config_path.exists():
-        return defaults
 
+def _read_config_cache(cache_path: str, key: list[Any]) -> Optional[dict[str, Any]]:
+    """Return the cached parsed config if its key matches, else None."""
     try:
-        content = config_path.read_text()
+        cached = json.loads(Path(cache_path).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    data = cached.get("config")
+    return data if isinstance(data, dict) else None
+
+
+def _write_config_cache(cache_path: str, key: list[Any], data: dict[str, Any]) -> None:
+    """Store parsed config data in the JSON cache.
+
+    Data that does not survive a JSON round trip unchanged (dates, non-string
+    keys) is not cached. Failures are ignored since the cache is optional.
+    """
+    try:
+        payload = dumps({"key": key, "config": data}, indent=False)
+        if json.loads(payload)["config"] != data:
+            return
+        Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(cache_path, payload)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def _parse_yaml(abs_path: str, config_file: str) -> Optional[dict[str, Any]]:
+    """Parse a YAML config file, returning None if it is empty."""
+    # Imported here since configs served from the JSON cache never need it
+    import yaml
+
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        # libyaml decodes the raw bytes itself, skipping a Python-level decode
+        content = Path(abs_path).read_bytes()
         if not content.strip():
-            return defaults
+            return None
 
-        data = yaml.safe_load(content)
+        data = yaml.load(content, Loader=loader)
         if not data:
-            return defaults
+            return None
         if not isinstance(data, dict):
             raise ConfigError(
                 "Top-level catalog config must be a mapping",
@@ -310,6 +566,35 @@ def load_config(config_path: Path | str) -> CatalogConfig:
             error_type="config_invalid",
         )
 
+    return data
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(
+    abs_path: str,
+    mtime_ns: int,
+    size: int,
+    config_file: str,
+    cache_path: Optional[str] = None,
+) -> CatalogConfig:
+    """Parse and validate a config file (cached by path, mtime, and size)."""
+    key: list[Any] = [abs_path, mtime_ns, size]
+    data = _read_config_cache(cache_path, key) if cache_path else None
+    if data is None:
+        data = _parse_yaml(abs_path, config_file)
+        if data is None:
+            return get_default_config()
+        if cache_path:
+            _write_config_cache(cache_path, key, data)
+
+    return _config_from_data(data, config_file)
+
+
+def _config_from_data(data: dict[str, Any], config_file: Optional[str] = None) -> CatalogConfig:
+    """Build and validate a CatalogConfig from parsed config data."""
+    # Start with defaults
+    defaults = get_default_config()
+
     # Build config from data, using defaults for missing values
     config = CatalogConfig(
         version=data.get("version", defaults.version),
@@ -3,12 +3,31 @@
 from __future__ import annotations
 
 import ast
+import os
+import re
+from collections import deque
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
+from itertools import chain, repeat
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
+from scripts.catalog.config import DATACLASS_SLOTS
 
-@dataclass
+# Files per task when parsing is spread over a process pool
+PARALLEL_CHUNK_SIZE = 64
+
+# Matches wherever an import statement could start: at the beginning of a
+# line, or after ';' or ':' (as in "try: import x"). A file without a match
+# has no imports, so it need not be parsed.
+_IMPORT_STATEMENT_RE = re.compile(r"(?:^|[;:])[ \t\f]*(?:import[ \t\f\\]|from[ \t\f\\.])", re.MULTILINE)
+
+# Node fields that hold nested statements (or handlers/cases wrapping them),
+# in ast field order
+_STATEMENT_FIELDS = ("body", "handlers", "orelse", "finalbody", "cases")
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ModuleDependencies:
     """Dependency information for a single module."""
 
@@ -17,13 +36,24 @@ class ModuleDependencies:
     external: list[str] = field(default_factory=list)  # External packages
 
 
-def _parse_python_file(file_path: Path) -> Optional[ast.AST]:
-    """Parse a Python file and return its AST."""
+def _parse_python_file(
+    file_path: Path,
+    skip_unless: Optional[re.Pattern[str]] = None,
+) -> Optional[ast.AST]:
+    """Parse a Python file and return its AST.
+
+    Args:
+        file_path: Path to the Python file.
+        skip_unless: Optional regex; files whose source has no match for it
+            are not parsed and return None.
+    """
     if file_path.suffix.lower() != ".py":
         return None
 
     try:
         content = file_path.read_text(encoding="utf-8")
+        if skip_unless is not None and not skip_unless.search(content):
+            return None
         return ast.parse(content, filename=str(file_path))
     except (SyntaxError, UnicodeDecodeError, IOError):
         return None
@@ -39,14 +69,19 @@ def extract_imports(file_path: Path | str) -> list[str]:
         List of imported module names (e.g., ['os', 'app.models.user']).
     """
     file_path = Path(file_path)
-    tree = _parse_python_file(file_path)
+    tree = _parse_python_file(file_path, skip_unless=_IMPORT_STATEMENT_RE)
 
     if tree is None:
         return []
 
     imports = []
 
-    for node in ast.walk(tree):
+    # Breadth-first over statements only, in the same order as ast.walk().
+    # Import statements can't appear inside expressions, so those subtrees
+    # are never visited.
+    queue = deque([tree])
+    while queue:
+        node = queue.popleft()
         if isinstance(node, ast.Import):
             # import os, sys
             for alias in node.names:
@@ -74,13 +109,35 @@ def extract_imports(file_path: Path | str) -> list[str]:
                     else:
                         imports.append(f"{prefix}{alias.name}")
 
+        else:
+            for name in _STATEMENT_FIELDS:
+                children = getattr(node, name, None)
+                if children:
+                    queue.extend(children)
+
     return imports
 
 
+def _path_exists(root: str, rel_path: str, known_paths: Optional[dict[str, bool]]) -> bool:
+    """Check whether a project-relative path exists, memoizing in known_paths."""
+    if known_paths is None:
+        return os.path.exists(os.path.join(root, rel_path))
+    found = known_paths.get(rel_path)
+    if found is None:
+        found = known_paths[rel_path] = os.path.exists(os.path.join(root, rel_path))
+    return found
+
+
+def _join(directory: str, name: str) -> str:
+    """Join relative path parts, treating "." as the project root."""
+    return name if directory == "." else f"{directory}/{name}"
+
+
 def resolve_import(
     import_name: str,
     root_dir: Path,
     current_file: Optional[Path] = None,
+    known_paths: Optional[dict[str, bool]] = None,
 ) -> Optional[str]:
     """Resolve an import name to a file path.
 
@@ -88,52 +145,50 @@ def resolve_import(
         import_name: The module name (e.g., 'app.models.user').
         root_dir: Project root directory.
         current_file: The file containing the import (for relative imports).
+        known_paths: Optional memo of relative path -> exists, shared across
+            calls so each candidate path is only checked on disk once.
 
     Returns:
         Relative file path if internal module, None if external.
     """
+    # Paths are handled as strings; Path objects are costly in this hot loop
+    root = str(root_dir)
+
     # Handle relative imports
     if import_name.startswith("."):
         if current_file is None:
             return None
 
         # Count leading dots
-        level = 0
-        for char in import_name:
-            if char == ".":
-                level += 1
-            else:
-                break
-
-        # Get the actual module name after dots
-        module_part = import_name[level:]
+        module_part = import_name.lstrip(".")
+        level = len(import_name) - len(module_part)
 
-        # Start from current file's directory
-        try:
-            current_dir = current_file.relative_to(root_dir).parent
-        except ValueError:
-            current_dir = current_file.parent
+        # Start from current file's directory (relative to root if inside it)
+        current = str(current_file)
+        root_prefix = root.rstrip("/") + "/"
+        if current.startswith(root_prefix):
+            current = current[len(root_prefix):]
+        current_dir = os.path.dirname(current) or "."
 
         # Go up 'level' directories (level=1 means same package)
         for _ in range(level - 1):
-            current_dir = current_dir.parent
+            current_dir = os.path.dirname(current_dir) or "."
 
         if module_part:
             # Combine with module path
-            module_path = module_part.replace(".", "/")
-            target_path = current_dir / module_path
+            target_path = _join(current_dir, module_part.replace(".", "/"))
         else:
             target_path = current_dir
 
         # Try as .py file
-        py_path = root_dir / f"{target_path}.py"
-        if py_path.exists():
-            return str(target_path) + ".py"
+        py_path = f"{target_path}.py"
+        if _path_exists(root, py_path, known_paths):
+            return py_path
 
         # Try as package
-        init_path = root_dir / target_path / "__init__.py"
-        if init_path.exists():
-            return str(target_path / "__init__.py")
+        init_path = _join(target_path, "__init__.py")
+        if _path_exists(root, init_path, known_paths):
+            return init_path
 
         return None
 
@@ -145,66 +200,123 @@ def resolve_import(
         module_path = "/".join(parts[:i])
 
         # Try as .py file
-        py_path = root_dir / f"{module_path}.py"
-        if py_path.exists():
-            return f"{module_path}.py"
+        py_path = f"{module_path}.py"
+        if _path_exists(root, py_path, known_paths):
+            return py_path
 
         # Try as package
-        init_path = root_dir / module_path / "__init__.py"
-        if init_path.exists():
-            return f"{module_path}/__init__.py"
+        init_path = f"{module_path}/__init__.py"
+        if _path_exists(root, init_path, known_paths):
+            return init_path
 
     # Not found in project - assume external
     return None
 
 
+def _analyze_file(
+    root_dir: Path,
+    file_path: str,
+    imports: Optional[list[str]] = None,
+    known_paths: Optional[dict[str, bool]] = None,
+) -> tuple[list[str], ModuleDependencies]:
+    """Extract and resolve the imports of a single file.
+
+    Args:
+        root_dir: Project root directory.
+        file_path: Relative path of the file to analyze.
+        imports: Previously extracted import names to resolve instead of
+            parsing the file again.
+        known_paths: Optional path-existence memo passed to resolve_import().
+
+    Returns:
+        Tuple of (raw import names, ModuleDependencies with imports and
+        external filled in). Files that do not exist or are not Python get
+        empty dependencies.
+    """
+    full_path = root_dir / file_path
+    if full_path.suffix != ".py" or not os.path.exists(full_path):
+        return [], ModuleDependencies()
+
+    if imports is None:
+        imports = extract_imports(full_path)
+
+    # Dicts deduplicate in O(1) while keeping first-seen order
+    internal: dict[str, None] = {}
+    external: dict[str, None] = {}
+    for import_name in imports:
+        resolved = resolve_import(import_name, root_dir, full_path, known_paths)
+
+        if resolved:
+            # Internal import
+            internal[resolved] = None
+        else:
+            # External import - extract base package name
+            base_package = import_name.lstrip(".").split(".")[0]
+            if base_package:
+                external[base_package] = None
+
+    return imports, ModuleDependencies(imports=list(internal), external=list(external))
+
+
+def _analyze_chunk(
+    root_dir: Path,
+    jobs: list[tuple[str, Optional[list[str]]]],
+) -> list[tuple[list[str], ModuleDependencies]]:
+    """Analyze a batch of (file path, cached imports) pairs (worker entry point).
+
+    Path lookups made while resolving imports are memoized for the batch,
+    since the same candidate paths come up again and again across files.
+    """
+    known_paths: dict[str, bool] = {}
+    return [_analyze_file(root_dir, file_path, imports, known_paths) for file_path, imports in jobs]
+
+
 def build_dependency_graph(
     root_dir: Path | str,
     file_paths: list[str],
+    executor: Optional[Executor] = None,
+    import_cache: Optional[dict[str, list[str]]] = None,
 ) -> dict[str, ModuleDependencies]:
     """Build a complete dependency graph for a set of files.
 
     Args:
         root_dir: Project root directory.
         file_paths: List of relative file paths to analyze.
+        executor: Optional process pool to parse files in parallel, in
+            batches of PARALLEL_CHUNK_SIZE. Runs serially if None or if
+            there is only one batch.
+        import_cache: Optional mapping of file paths to the import names
+            extracted from them by an earlier build. Files found here are
+            not parsed again, only re-resolved. Updated in place with the
+            imports of every analyzed file.
 
     Returns:
         Dictionary mapping file paths to their dependencies.
     """
     root_dir = Path(root_dir)
-    graph: dict[str, ModuleDependencies] = {}
-
-    # Initialize all files in graph
-    for file_path in file_paths:
-        graph[file_path] = ModuleDependencies()
+    cached = import_cache if import_cache is not None else {}
+    jobs = [(file_path, cached.get(file_path)) for file_path in file_paths]
 
-    # First pass: extract imports and resolve to paths
-    for file_path in file_paths:
-        full_path = root_dir / file_path
-        if not full_path.exists() or full_path.suffix != ".py":
-            continue
+    # First pass: extract imports and resolve to paths. A single batch is
+    # cheaper to analyze here than to ship to a worker process.
+    if executor is None or len(jobs) <= PARALLEL_CHUNK_SIZE:
+        analyzed: Iterable[tuple[list[str], ModuleDependencies]] = _analyze_chunk(root_dir, jobs)
+    else:
+        chunks = [jobs[i:i + PARALLEL_CHUNK_SIZE] for i in range(0, len(jobs), PARALLEL_CHUNK_SIZE)]
+        analyzed = chain.from_iterable(executor.map(_analyze_chunk, repeat(root_dir), chunks))
 
-        imports = extract_imports(full_path)
-        deps = graph[file_path]
-
-        for import_name in imports:
-            resolved = resolve_import(import_name, root_dir, full_path)
-
-            if resolved:
-                # Internal import
-                if resolved not in deps.imports:
-                    deps.imports.append(resolved)
-            else:
-                # External import - extract base package name
-                base_package = import_name.lstrip(".").split(".")[0]
-                if base_package and base_package not in deps.external:
-                    deps.external.append(base_package)
+    graph: dict[str, ModuleDependencies] = {}
+    for file_path, (imports, deps) in zip(file_paths, analyzed):
+        graph[file_path] = deps
+        if import_cache is not None:
+            import_cache[file_path] = imports
 
-    # Second pass: build reverse dependencies (imported_by)
+    # Second pass: build reverse dependencies (imported_by). A file's imports
+    # are already unique, so each importer is appended at most once.
     for file_path, deps in graph.items():
         for imported_file in deps.imports:
-            if imported_file in graph:
-                if file_path not in graph[imported_file].imported_by:
-                    graph[imported_file].imported_by.append(file_path)
+            target = graph.get(imported_file)
+            if target is not None:
+                target.imported_by.append(file_path)
 
     return graph
@@ -4,45 +4,144 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from scripts.catalog.config import DATACLASS_SLOTS
+from scripts.catalog.serialization import dump_file, load_file
 
-@dataclass
+try:
+    from blake3 import blake3 as _new_hasher
+
+    HASH_ALGORITHM = "blake3"
+except ImportError:
+    _new_hasher = hashlib.sha256
+    HASH_ALGORITHM = "sha256"
+
+# Hashing is mostly I/O wait, so use several threads per core
+HASH_POOL_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Below this many files, hash serially rather than starting a pool
+HASH_POOL_MIN_FILES = 16
+
+
+@dataclass(**DATACLASS_SLOTS)
 class CatalogState:
     """Persisted state for incremental builds."""
 
-    file_hashes: dict[str, str] = field(default_factory=dict)  # path -> SHA-256
+    file_hashes: dict[str, str] = field(default_factory=dict)  # path -> content hash
+    file_meta: dict[str, list[int]] = field(default_factory=dict)  # path -> [size, mtime_ns]
     last_build: Optional[str] = None  # ISO timestamp
+    hash_algorithm: str = HASH_ALGORITHM  # algorithm used for file_hashes
+    file_imports: dict[str, list[str]] = field(default_factory=dict)  # path -> import names
 
 
 def compute_file_hash(file_path: Path | str) -> Optional[str]:
-    """Compute SHA-256 hash of a file.
+    """Compute the content hash of a file.
+
+    Uses BLAKE3 when the blake3 package is installed and SHA-256 otherwise
+    (see HASH_ALGORITHM). The hash only detects changes; it is not used for
+    security.
 
     Args:
         file_path: Path to the file.
 
     Returns:
-        Hex string of SHA-256 hash, or None if file cannot be read.
+        Hex string of the hash, or None if file cannot be read.
     """
-    file_path = Path(file_path)
-
-    if not file_path.exists():
-        return None
-
     try:
-        hasher = hashlib.sha256()
-        with open(file_path, "rb") as f:
+        with open(file_path, "rb", buffering=0) as f:
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                return hashlib.file_digest(f, _new_hasher).hexdigest()
+            hasher = _new_hasher()
             # Read in chunks for memory efficiency on large files
-            for chunk in iter(lambda: f.read(8192), b""):
+            for chunk in iter(lambda: f.read(65536), b""):
                 hasher.update(chunk)
-        return hasher.hexdigest()
+            return hasher.hexdigest()
     except (IOError, OSError):
         return None
 
 
+def stat_files(
+    root_dir: Path,
+    file_paths: list[str],
+) -> dict[str, list[int]]:
+    """Collect size and modification time for many files.
+
+    Args:
+        root_dir: Project root directory.
+        file_paths: List of relative file paths to stat.
+
+    Returns:
+        Dictionary mapping relative paths to [size, mtime_ns]. Files that do
+        not exist or cannot be accessed are omitted.
+    """
+    root = str(root_dir)
+    file_meta: dict[str, list[int]] = {}
+    for file_path in file_paths:
+        try:
+            st = os.stat(os.path.join(root, file_path))
+        except OSError:
+            continue
+        file_meta[file_path] = [st.st_size, st.st_mtime_ns]
+    return file_meta
+
+
+def compute_file_hashes(
+    root_dir: Path,
+    file_paths: list[str],
+    state: Optional[CatalogState] = None,
+    file_meta: Optional[dict[str, list[int]]] = None,
+) -> dict[str, str]:
+    """Compute content hashes for many files using a thread pool.
+
+    When a previous state is given, files whose size and mtime match the
+    recorded values reuse the stored hash without being read. Remaining
+    files are hashed on a thread pool; reads and hashing release the GIL,
+    so file I/O and hash computation overlap across files. Small batches
+    are hashed serially.
+
+    Args:
+        root_dir: Project root directory.
+        file_paths: List of relative file paths to hash.
+        state: Previous build state to reuse unchanged hashes from.
+        file_meta: Current metadata from stat_files(). Computed if None and
+            state is given.
+
+    Returns:
+        Dictionary mapping relative paths to hex hashes. Files that do not
+        exist or cannot be read are omitted.
+    """
+    hashes: dict[str, str] = {}
+    to_hash = file_paths
+
+    if state is not None and state.file_meta:
+        if file_meta is None:
+            file_meta = stat_files(root_dir, file_paths)
+        to_hash = []
+        for file_path in file_paths:
+            previous_hash = state.file_hashes.get(file_path)
+            meta = file_meta.get(file_path)
+            if previous_hash is not None and meta is not None and meta == state.file_meta.get(file_path):
+                hashes[file_path] = previous_hash
+            else:
+                to_hash.append(file_path)
+
+    if len(to_hash) < HASH_POOL_MIN_FILES:
+        # Not worth starting threads for a handful of files
+        results = map(compute_file_hash, [root_dir / p for p in to_hash])
+        hashes.update((p, h) for p, h in zip(to_hash, results) if h is not None)
+    else:
+        with ThreadPoolExecutor(max_workers=HASH_POOL_MAX_WORKERS) as pool:
+            results = pool.map(compute_file_hash, [root_dir / p for p in to_hash])
+            hashes.update((p, h) for p, h in zip(to_hash, results) if h is not None)
+
+    return hashes
+
+
 def load_state(state_path: Path | str) -> CatalogState:
     """Load catalog state from file.
 
@@ -58,11 +157,15 @@ def load_state(state_path: Path | str) -> CatalogState:
         return CatalogState()
 
     try:
-        content = state_path.read_text(encoding="utf-8")
-        data = json.loads(content)
+        data = load_file(state_path)
+        if data.get("hash_algorithm", "sha256") != HASH_ALGORITHM:
+            # Hashes from another algorithm can't be compared; rebuild fully
+            return CatalogState()
         return CatalogState(
             file_hashes=data.get("file_hashes", {}),
+            file_meta=data.get("file_meta", {}),
             last_build=data.get("last_build"),
+            file_imports=data.get("file_imports", {}),
         )
     except (json.JSONDecodeError, IOError):
         return CatalogState()
@@ -71,6 +174,9 @@ def load_state(state_path: Path | str) -> CatalogState:
 def save_state(state: CatalogState, state_path: Path | str) -> None:
     """Save catalog state to file.
 
+    The file is replaced atomically, so an interrupted build never leaves a
+    truncated state behind.
+
     Args:
         state: CatalogState to save.
         state_path: Path to .catalog_state.json.
@@ -79,16 +185,20 @@ def save_state(state: CatalogState, state_path: Path | str) -> None:
 
     data = {
         "file_hashes": state.file_hashes,
+        "file_meta": state.file_meta,
         "last_build": state.last_build,
+        "hash_algorithm": state.hash_algorithm,
+        "file_imports": state.file_imports,
     }
 
-    state_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    dump_file(state_path, data)
 
 
 def get_changed_files(
     root_dir: Path,
     file_paths: list[str],
     state: CatalogState,
+    hashes: Optional[dict[str, str]] = None,
 ) -> list[str]:
     """Determine which files have changed since last build.
 
@@ -96,15 +206,18 @@ def get_changed_files(
         root_dir: Project root directory.
         file_paths: List of relative file paths to check.
         state: Previous build state.
+        hashes: Current hashes from compute_file_hashes(). Computed if None.
 
     Returns:
         List of relative paths that have changed (new, modified, or not in state).
     """
+    if hashes is None:
+        hashes = compute_file_hashes(root_dir, file_paths, state)
+
     changed = []
 
     for file_path in file_paths:
-        full_path = root_dir / file_path
-        current_hash = compute_file_hash(full_path)
+        current_hash = hashes.get(file_path)
 
         if current_hash is None:
             # File doesn't exist or can't be read - skip
@@ -122,18 +235,29 @@ def update_state_hashes(
     root_dir: Path,
     file_paths: list[str],
     state: CatalogState,
+    hashes: Optional[dict[str, str]] = None,
+    file_meta: Optional[dict[str, list[int]]] = None,
 ) -> None:
-    """Update state with current file hashes.
+    """Update state with current file hashes and metadata.
 
     Args:
         root_dir: Project root directory.
         file_paths: List of relative file paths to update.
         state: State to update (modified in place).
+        hashes: Current hashes from compute_file_hashes(). Computed if None.
+        file_meta: Current metadata from stat_files(). Computed if None.
     """
+    if file_meta is None:
+        file_meta = stat_files(root_dir, file_paths)
+    if hashes is None:
+        hashes = compute_file_hashes(root_dir, file_paths, state, file_meta)
+
     for file_path in file_paths:
-        full_path = root_dir / file_path
-        file_hash = compute_file_hash(full_path)
+        file_hash = hashes.get(file_path)
         if file_hash:
             state.file_hashes[file_path] = file_hash
+            meta = file_meta.get(file_path)
+            if meta is not None:
+                state.file_meta[file_path] = meta
 
     state.last_build = datetime.now(timezone.utc).isoformat()
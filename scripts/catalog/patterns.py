@@ -3,111 +3,315 @@
 from __future__ import annotations
 
 import fnmatch
+import functools
+import os
 import re
+import stat
 from pathlib import Path
-from typing import Optional
+from typing import Collection, Optional, Sequence
 
 
-def match_directory_pattern(file_path: str | Path, pattern: str) -> bool:
+# Compiled pattern caches are sized well above any realistic rule count
+PATTERN_CACHE_SIZE = 4096
+
+# Bytes inspected when deciding whether a file is binary
+TEXT_SNIFF_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_content_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a content regex, caching the result for the process.
+
+    Raises:
+        re.error: If the pattern is not a valid regex.
+    """
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_filename_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a filename glob into a regex with fnmatch semantics."""
+    return re.compile(fnmatch.translate(os.path.normcase(pattern)))
+
+
+def compile_directory_pattern(pattern: str) -> Optional[re.Pattern[str]]:
+    """Compile a directory glob into an anchored regex.
+
+    Returns:
+        The compiled regex, or None if the pattern cannot be compiled.
+    """
+    return _glob_to_regex(pattern.lstrip("./"))
+
+
+def _translate_segment(segment: str) -> str:
+    """Translate one path segment of a glob into regex source.
+
+    ``*`` and ``?`` never match ``/``; ``[...]`` classes follow fnmatch rules.
+    """
+    out = []
+    i, n = 0, len(segment)
+    while i < n:
+        c = segment[i]
+        i += 1
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and segment[j] == "!":
+                j += 1
+            if j < n and segment[j] == "]":
+                j += 1
+            while j < n and segment[j] != "]":
+                j += 1
+            if j >= n:
+                # Unclosed bracket matches literally, as in fnmatch
+                out.append(r"\[")
+                continue
+            stuff = segment[i:j].replace("\\", "\\\\")
+            stuff = re.sub(r"([&~|])", r"\\\1", stuff)
+            i = j + 1
+            if stuff.startswith("!"):
+                stuff = "^/" + stuff[1:]
+            elif stuff[:1] in ("^", "["):
+                stuff = "\\" + stuff
+            out.append(f"[{stuff}]")
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
+
+
+@functools.lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _glob_to_regex(pattern: str) -> Optional[re.Pattern[str]]:
+    """Translate a normalized directory glob into a compiled, anchored regex.
+
+    A ``**`` segment matches zero or more directories, or everything below
+    when it is the last segment. Other segments match exactly one path
+    segment. Patterns containing ``**`` also match anything below a path
+    they match, so "src/**/api" covers files inside any api directory.
+    """
+    segments = pattern.split("/")
+    last = len(segments) - 1
+    parts = []
+    for i, seg in enumerate(segments):
+        if seg == "**":
+            parts.append(".*" if i == last else "(?:.*/)?")
+        else:
+            parts.append(_translate_segment(seg) + ("" if i == last else "/"))
+    if "**" in segments and segments[-1] != "**":
+        parts.append("(?:/.*)?")
+
+    try:
+        return re.compile("".join(parts) + r"\Z", re.DOTALL)
+    except re.error:
+        return None
+
+
+def compile_directory_alternation(patterns: Sequence[str]) -> Optional[re.Pattern[str]]:
+    """Compile several directory globs into one regex alternation.
+
+    Alternatives are tried in order, so on a match the first matching glob
+    is reported by directory_alternation_index().
+
+    Returns:
+        The compiled regex, or None if any pattern cannot be compiled.
+    """
+    sources = []
+    for i, pattern in enumerate(patterns):
+        regex = compile_directory_pattern(pattern)
+        if regex is None:
+            return None
+        sources.append(f"(?P<p{i}>{regex.pattern})")
+    try:
+        return re.compile("|".join(sources), re.DOTALL)
+    except re.error:
+        return None
+
+
+def compile_filename_alternation(patterns: Sequence[str]) -> re.Pattern[str]:
+    """Compile several filename globs into one regex alternation.
+
+    Like compile_filename_pattern(), the result is matched against the
+    normcased file name. Alternatives are tried in order, so on a match the
+    first matching glob is reported by directory_alternation_index().
+    """
+    return re.compile(
+        "|".join(f"(?P<p{i}>{compile_filename_pattern(p).pattern})" for i, p in enumerate(patterns))
+    )
+
+
+def directory_alternation_index(match: re.Match[str]) -> int:
+    """Return the index of the glob that produced an alternation match.
+
+    Works for both compile_directory_alternation() and
+    compile_filename_alternation() matches.
+    """
+    return int(match.lastgroup[1:]) if match.lastgroup else -1
+
+
+def match_directory_pattern(file_path: str | Path, pattern: str | re.Pattern[str]) -> bool:
     """Match a file path against a directory glob pattern.
 
     Args:
         file_path: The file path to check (relative to project root).
-        pattern: A glob pattern like "app/services/**" or "**/utils/**".
+        pattern: A glob pattern like "app/services/**" or "**/utils/**", or
+                 a regex precompiled by compile_directory_pattern().
 
     Returns:
         True if the file path matches the pattern.
     """
     # Normalize the file path
     path_str = str(file_path).lstrip("./")
-    pattern = pattern.lstrip("./")
-
-    # Handle ** patterns with proper glob semantics
-    if "**" in pattern:
-        # Build a regex pattern manually for proper ** handling
-        # ** matches zero or more directories
-        parts = []
-        segments = pattern.split("/")
-        for seg in segments:
-            if seg == "**":
-                # Match zero or more directory levels
-                parts.append("(?:.*/)?")
-            else:
-                # Convert glob wildcards to regex
-                seg_re = seg.replace(".", r"\.")
-                seg_re = seg_re.replace("*", "[^/]*")
-                seg_re = seg_re.replace("?", "[^/]")
-                parts.append(seg_re)
-
-        # Join with / and anchor
-        regex_pattern = "^" + "/".join(parts).replace("/(?:.*/)?/", "/(?:.*/)?")
-        # Handle leading **
-        if pattern.startswith("**/"):
-            regex_pattern = "^(?:.*/)?".join(regex_pattern.split("^(?:.*/)?/", 1))
-
-        try:
-            return bool(re.match(regex_pattern, path_str))
-        except re.error:
-            return False
-
-    # For patterns without **, use fnmatch but ensure * doesn't cross directory boundaries
-    # Split both by / and match segment by segment
-    path_parts = path_str.split("/")
-    pattern_parts = pattern.split("/")
-
-    if len(path_parts) != len(pattern_parts):
-        return False
-
-    for path_part, pattern_part in zip(path_parts, pattern_parts):
-        if not fnmatch.fnmatch(path_part, pattern_part):
-            return False
+    regex = compile_directory_pattern(pattern) if isinstance(pattern, str) else pattern
+    return regex is not None and regex.match(path_str) is not None
 
-    return True
 
-
-def match_filename_pattern(file_path: str | Path, pattern: str) -> bool:
+def match_filename_pattern(file_path: str | Path, pattern: str | re.Pattern[str]) -> bool:
     """Match a filename against a filename pattern.
 
     Args:
         file_path: The file path (uses only the filename part).
-        pattern: A filename pattern like "test_*.py" or "Dockerfile*".
+        pattern: A filename pattern like "test_*.py" or "Dockerfile*", or a
+                 regex precompiled by compile_filename_pattern().
 
     Returns:
         True if the filename matches the pattern.
     """
-    filename = Path(file_path).name
+    filename = os.path.basename(file_path)
+    if isinstance(pattern, re.Pattern):
+        return pattern.match(os.path.normcase(filename)) is not None
     return fnmatch.fnmatch(filename, pattern)
 
 
-def _is_text_file(file_path: Path) -> bool:
-    """Check if a file is likely a text file."""
+@functools.lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _ascii_bytes_pattern(regex: re.Pattern[str]) -> Optional[re.Pattern[bytes]]:
+    """Compile the bytes equivalent of a text regex, for ASCII-only content.
+
+    On ASCII input the two behave identically, except that text-mode \\s
+    also matches \\x1c-\\x1f. Returns None for such patterns and for
+    patterns that are not pure ASCII or cannot be compiled as bytes.
+    """
+    source = regex.pattern
+    if not source.isascii() or "\\s" in source or "\\S" in source:
+        return None
+    try:
+        return re.compile(source.encode("ascii"), regex.flags & ~re.UNICODE)
+    except re.error:
+        return None
+
+
+# One alternative of a pattern made only of literal text: ordinary
+# characters, or backslash escapes of punctuation (which match themselves)
+_LITERAL_ALTERNATIVE_RE = re.compile(r"(?:[^\\.^$*+?{}\[\]()|]|\\[^A-Za-z0-9])*")
+_LITERAL_ESCAPE_RE = re.compile(r"\\(.)", re.DOTALL)
+
+
+@functools.lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _literal_alternatives(regex: re.Pattern[str]) -> Optional[tuple[bytes, ...]]:
+    """Split a regex of plain ASCII literals, like "CREATE TABLE|ALTER TABLE".
+
+    Such a pattern is found exactly when one of its literals occurs in the
+    text. Substring tests (memchr-based) are much faster than the regex
+    engine at that, especially for alternations, which it tries one
+    position at a time. ASCII literals appear in UTF-8 text exactly when
+    their bytes appear in the raw data, so no decoding is needed either.
+
+    Returns:
+        The literals as bytes, or None if the pattern is not of this form.
+    """
+    source = regex.pattern
+    if regex.flags != re.UNICODE or not source.isascii():
+        return None
+    alternatives = source.split("|")
+    if not all(_LITERAL_ALTERNATIVE_RE.fullmatch(alt) for alt in alternatives):
+        return None
+    return tuple(_LITERAL_ESCAPE_RE.sub(r"\1", alt).encode("ascii") for alt in alternatives)
+
+
+def read_content(file_path: str | Path, max_file_size: int = 1048576) -> Optional[bytes]:
+    """Read a file for content matching.
+
+    Files are read once as bytes. Files with a null byte in their first
+    TEXT_SNIFF_SIZE bytes are treated as binary. Line endings are
+    normalized to "\\n".
+
+    Args:
+        file_path: The file to read.
+        max_file_size: Maximum file size to read (default 1MB).
+
+    Returns:
+        The normalized content, or None if the file is missing, not a
+        regular file, too large, unreadable, or binary.
+    """
+    # Check file exists, is a regular file, and is not too large
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode) or st.st_size > max_file_size:
+        return None
+
     try:
         with open(file_path, "rb") as f:
-            chunk = f.read(1024)
-            # Check for null bytes (common in binary files)
-            if b"\x00" in chunk:
-                return False
-            # Try to decode as UTF-8
-            try:
-                chunk.decode("utf-8")
-                return True
-            except UnicodeDecodeError:
-                return False
-    except IOError:
-        return False
+            # Bounded in case the file grew since the stat
+            data = f.read(max_file_size + 1)
+    except (IOError, OSError):
+        return None
+    if len(data) > max_file_size:
+        return None
+
+    # Check if it's a text file
+    if b"\x00" in data[:TEXT_SNIFF_SIZE]:
+        return None
+
+    # Same newline handling as reading in text mode
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return data
+
+
+def search_content(content: bytes, pattern: str | re.Pattern[str]) -> bool:
+    """Search content returned by read_content() for a regex pattern.
+
+    Patterns of plain ASCII literals are found with substring tests. For
+    other patterns, pure ASCII content is searched as bytes without
+    decoding; anything else is decoded as UTF-8 with undecodable bytes
+    replaced.
+
+    Args:
+        content: File content from read_content().
+        pattern: A regex pattern to search for, as a string or compiled.
+
+    Returns:
+        True if the pattern is found.
+    """
+    if isinstance(pattern, str):
+        pattern = compile_content_pattern(pattern)
+    literals = _literal_alternatives(pattern)
+    if literals is not None:
+        return any(literal in content for literal in literals)
+    if content.isascii():
+        bytes_pattern = _ascii_bytes_pattern(pattern)
+        if bytes_pattern is not None:
+            return bytes_pattern.search(content) is not None
+    return pattern.search(content.decode("utf-8", errors="replace")) is not None
 
 
 def match_content_pattern(
     file_path: str | Path,
-    pattern: str,
-    filetypes: Optional[list[str]] = None,
+    pattern: str | re.Pattern[str],
+    filetypes: Optional[Collection[str]] = None,
     max_file_size: int = 1048576,
 ) -> bool:
     """Match file content against a regex pattern.
 
+    The file is read with read_content() and searched with search_content(),
+    so binary files never match.
+
     Args:
         file_path: The file to check.
-        pattern: A regex pattern to search for.
+        pattern: A regex pattern to search for, as a string or compiled.
         filetypes: Optional list of file extensions to match (e.g., [".py", ".ts"]).
                    If None, matches any text file.
         max_file_size: Maximum file size to scan (default 1MB).
@@ -117,34 +321,15 @@ def match_content_pattern(
     """
     file_path = Path(file_path)
 
-    # Check filetype restriction (case-insensitive)
+    # Check filetype restriction (case-insensitive). An exact hit on the
+    # lowercased suffix, as with Rule.filetypes_set, skips lowercasing them.
     if filetypes is not None:
         suffix = file_path.suffix.lower()
-        filetypes_lower = [ft.lower() for ft in filetypes]
-        if suffix not in filetypes_lower:
+        if suffix not in filetypes and suffix not in {ft.lower() for ft in filetypes}:
             return False
 
-    # Check file exists and is a file
-    if not file_path.is_file():
-        return False
-
-    # Check file size
-    try:
-        if file_path.stat().st_size > max_file_size:
-            return False
-    except OSError:
-        return False
-
-    # Check if it's a text file
-    if not _is_text_file(file_path):
-        return False
-
-    # Read and match
-    try:
-        content = file_path.read_text(encoding="utf-8", errors="replace")
-        return bool(re.search(pattern, content))
-    except (IOError, OSError):
-        return False
+    content = read_content(file_path, max_file_size)
+    return content is not None and search_content(content, pattern)
 
 
 def get_confidence_for_match(rule_type: str, pattern: str) -> str:
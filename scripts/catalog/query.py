@@ -2,50 +2,248 @@
 
 from __future__ import annotations
 
-import json
+import functools
+import marshal
+import os
+import sys
+import weakref
 from pathlib import Path
 from typing import Any, Optional
 
+from scripts.catalog.serialization import load_file, read_sidecar, write_sidecar
 
-def load_classification_index(index_path: Path | str) -> Optional[dict[str, Any]]:
+# File classifications of an index grouped by primary category:
+# {category: [(file_path, classification)]}
+CategoryIndex = dict[str, list[tuple[str, dict[str, Any]]]]
+
+# Shared fallback for missing index sections that are only read, never
+# returned to callers
+_EMPTY: dict[str, Any] = {}
+
+
+def load_classification_index(
+    index_path: Path | str,
+    sidecar_dir: Path | str | None = None,
+) -> Optional[dict[str, Any]]:
     """Load a classification index from file.
 
     Args:
         index_path: Path to file_classification.json.
+        sidecar_dir: Optional directory holding the index's binary sidecar,
+            which is loaded instead of the JSON while it is up to date.
+            A missing or stale sidecar is rewritten there if the directory
+            exists; nothing is ever written next to the index itself.
 
     Returns:
-        Index data or None if loading fails.
+        Index data or None if loading fails. The data belongs to the caller.
     """
-    index_path = Path(index_path)
-    if not index_path.exists():
-        return None
+    loaded = _load_index(index_path, sidecar_dir)
+    return loaded.copy() if loaded is not None else None
 
-    try:
-        content = index_path.read_text(encoding="utf-8")
-        return json.loads(content)
-    except (json.JSONDecodeError, IOError):
-        return None
+
+def load_classification_index_shared(
+    index_path: Path | str,
+    sidecar_dir: Path | str | None = None,
+) -> Optional[dict[str, Any]]:
+    """Load a classification index without copying it.
+
+    Like load_classification_index, but returns the cached data itself, which is
+    shared by all callers loading the unchanged file. For read-only use.
+
+    Args:
+        index_path: Path to file_classification.json.
+        sidecar_dir: Optional directory holding the index's binary sidecar.
+
+    Returns:
+        Index data or None if loading fails. Must not be modified.
+    """
+    loaded = _load_index(index_path, sidecar_dir)
+    return loaded.data if loaded is not None else None
 
 
-def load_dependencies_index(index_path: Path | str) -> Optional[dict[str, Any]]:
+def load_dependencies_index(
+    index_path: Path | str,
+    sidecar_dir: Path | str | None = None,
+) -> Optional[dict[str, Any]]:
     """Load a dependencies index from file.
 
     Args:
         index_path: Path to module_dependencies.json.
+        sidecar_dir: Optional directory holding the index's binary sidecar,
+            which is loaded instead of the JSON while it is up to date.
+            A missing or stale sidecar is rewritten there if the directory
+            exists; nothing is ever written next to the index itself.
 
     Returns:
-        Index data or None if loading fails.
+        Index data or None if loading fails. The data belongs to the caller.
     """
+    loaded = _load_index(index_path, sidecar_dir)
+    return loaded.copy() if loaded is not None else None
+
+
+def load_dependencies_index_shared(
+    index_path: Path | str,
+    sidecar_dir: Path | str | None = None,
+) -> Optional[dict[str, Any]]:
+    """Load a dependencies index without copying it.
+
+    Like load_dependencies_index, but returns the cached data itself, which is
+    shared by all callers loading the unchanged file. For read-only use.
+
+    Args:
+        index_path: Path to module_dependencies.json.
+        sidecar_dir: Optional directory holding the index's binary sidecar.
+
+    Returns:
+        Index data or None if loading fails. Must not be modified.
+    """
+    loaded = _load_index(index_path, sidecar_dir)
+    return loaded.data if loaded is not None else None
+
+
+class _LoadedIndex:
+    """The data of an index file, as cached by the loaders."""
+
+    def __init__(self, data: Any, payload: Optional[bytes] = None) -> None:
+        self.data = data
+        # Marshalled data, for copies; the sidecar's if loaded from one
+        self._payload = payload
+        # Query structures derived from the (read-only) data on first use
+        self.by_category: Optional[CategoryIndex] = None
+        self.imported_by: Optional[dict[str, list[str]]] = None
+        _shared_indexes[id(data)] = self
+
+    def copy(self) -> Any:
+        """Return a deep copy of the data.
+
+        Unmarshalling is much faster than parsing the JSON again or
+        copy.deepcopy(), and keeps the interned strings interned.
+        """
+        if self._payload is None:
+            self._payload = marshal.dumps(self.data)
+        return marshal.loads(self._payload)
+
+
+# Cached indexes by id() of their data, to recognize shared data passed to the
+# query functions; entries go away when the loader cache evicts them
+_shared_indexes: weakref.WeakValueDictionary[int, _LoadedIndex] = weakref.WeakValueDictionary()
+
+
+def _shared_index(index: Any) -> Optional[_LoadedIndex]:
+    """Return the cache entry if ``index`` is shared data from the loaders."""
+    loaded = _shared_indexes.get(id(index))
+    return loaded if loaded is not None and loaded.data is index else None
+
+
+def _load_index(index_path: Path | str, sidecar_dir: Path | str | None = None) -> Optional[_LoadedIndex]:
+    """Load an index file, reusing the parsed data while the file is unchanged."""
     index_path = Path(index_path)
-    if not index_path.exists():
+    try:
+        st = index_path.stat()
+    except OSError:
         return None
 
+    return _load_index_cached(
+        os.path.abspath(index_path),
+        st.st_mtime_ns,
+        st.st_size,
+        str(sidecar_dir) if sidecar_dir is not None else None,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _load_index_cached(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    sidecar_dir: Optional[str] = None,
+) -> Optional[_LoadedIndex]:
+    """Parse an index file (cached by path, mtime, and size)."""
+    index_path = Path(path)
+
+    if sidecar_dir is not None:
+        payload = read_sidecar(index_path, sidecar_dir, mtime_ns, size)
+        if payload is not None:
+            try:
+                cached = marshal.loads(payload)
+            except (EOFError, ValueError, TypeError):
+                cached = None
+            if isinstance(cached, dict):
+                return _LoadedIndex(cached, payload)
+
     try:
-        content = index_path.read_text(encoding="utf-8")
-        return json.loads(content)
-    except (json.JSONDecodeError, IOError):
+        data = load_file(index_path)
+    except (ValueError, OSError):
         return None
 
+    if isinstance(data, dict):
+        _intern_classifications(data)
+
+        # Missing or stale sidecar (e.g. an index written by an older version):
+        # write one so the next process can skip parsing the JSON. It records
+        # the stat taken before reading, so it is never used if the index was
+        # rewritten meanwhile.
+        if sidecar_dir is not None:
+            write_sidecar(index_path, sidecar_dir, data, mtime_ns, size)
+    return _LoadedIndex(data)
+
+
+def _intern_classifications(index: dict[str, Any]) -> None:
+    """Intern the category and confidence strings of a classification index.
+
+    A JSON parser creates a new string per occurrence, though these fields
+    only take a handful of distinct values. Interning shares one object per
+    value, and marshal keeps strings interned, so sidecars written from the
+    data load them interned too.
+    """
+    files = index.get("files")
+    if not isinstance(files, dict):
+        return
+
+    intern = sys.intern
+    for classification in files.values():
+        if not isinstance(classification, dict):
+            continue
+        for key in ("primary_category", "confidence"):
+            value = classification.get(key)
+            if isinstance(value, str):
+                classification[key] = intern(value)
+        categories = classification.get("categories")
+        if isinstance(categories, list):
+            classification["categories"] = [intern(c) if isinstance(c, str) else c for c in categories]
+
+
+def _category_index(index: dict[str, Any]) -> Optional[CategoryIndex]:
+    """Group a shared index's files by primary category, once per index.
+
+    Only data from the *_shared loaders is grouped, since it is never
+    modified; returns None for any other index.
+    """
+    loaded = _shared_index(index)
+    if loaded is None:
+        return None
+
+    if loaded.by_category is None:
+        by_category: CategoryIndex = {}
+        for file_path, classification in index.get("files", _EMPTY).items():
+            by_category.setdefault(classification.get("primary_category"), []).append(
+                (file_path, classification)
+            )
+        loaded.by_category = by_category
+    return loaded.by_category
+
+
+def _file_result(file_path: str, classification: dict[str, Any]) -> dict[str, Any]:
+    """Merge a file path into a copy of its classification.
+
+    List values (categories, matched_rules) are copied too, so the result
+    never aliases the index data.
+    """
+    result: dict[str, Any] = {"file_path": file_path}
+    for key, value in classification.items():
+        result[key] = list(value) if isinstance(value, list) else value
+    return result
+
 
 def query_by_category(
     index: dict[str, Any],
@@ -53,24 +251,29 @@ def query_by_category(
 ) -> list[dict[str, Any]]:
     """Query files by category.
 
+    For indexes from the *_shared loaders, files are grouped by category on
+    the first query, so further queries only build the matching results.
+
     Args:
         index: Classification index data.
         category: Category name to filter by.
 
     Returns:
-        List of file classifications in that category.
+        List of file classifications in that category. The results are
+        copies, so they can be modified without affecting the index.
     """
-    results = []
-    files = index.get("files", {})
-
-    for file_path, classification in files.items():
-        if classification.get("primary_category") == category:
-            results.append({
-                "file_path": file_path,
-                **classification,
-            })
+    by_category = _category_index(index)
+    if by_category is not None:
+        return [
+            _file_result(file_path, classification)
+            for file_path, classification in by_category.get(category, ())
+        ]
 
-    return results
+    return [
+        _file_result(file_path, classification)
+        for file_path, classification in index.get("files", _EMPTY).items()
+        if classification.get("primary_category") == category
+    ]
 
 
 def query_by_file(
@@ -84,26 +287,47 @@ def query_by_file(
         file_path: Relative path to the file.
 
     Returns:
-        File classification or None if not found.
+        File classification or None if not found. The result is a copy,
+        so it can be modified without affecting the index.
     """
-    files = index.get("files", {})
+    files = index.get("files", _EMPTY)
     classification = files.get(file_path)
 
     if classification:
-        return {
-            "file_path": file_path,
-            **classification,
-        }
+        return _file_result(file_path, classification)
 
     return None
 
 
+def _imported_by_index(index: dict[str, Any]) -> Optional[dict[str, list[str]]]:
+    """Derive a shared index's imported_by lists from its imports, once per index.
+
+    Only data from the *_shared loaders is indexed, since it is never
+    modified; returns None for any other index.
+    """
+    loaded = _shared_index(index)
+    if loaded is None:
+        return None
+
+    if loaded.imported_by is None:
+        imported_by: dict[str, list[str]] = {}
+        for module, info in index.get("modules", _EMPTY).items():
+            for imported_file in info.get("imports", ()):
+                imported_by.setdefault(imported_file, []).append(module)
+        loaded.imported_by = imported_by
+    return loaded.imported_by
+
+
 def query_depends_on(
     index: dict[str, Any],
     file_path: str,
 ) -> list[str]:
     """Query files that depend on (import) a given file.
 
+    If the index stores no "imported_by" list for the file, it is derived
+    from the other modules' imports (once per index for indexes from the
+    *_shared loaders).
+
     Args:
         index: Dependencies index data.
         file_path: Relative path to the file.
@@ -111,13 +335,21 @@ def query_depends_on(
     Returns:
         List of file paths that import this file.
     """
-    modules = index.get("modules", {})
+    modules = index.get("modules", _EMPTY)
     module_info = modules.get(file_path)
 
-    if module_info:
-        return module_info.get("imported_by", [])
+    if not module_info:
+        return []
+
+    imported_by = module_info.get("imported_by")
+    if imported_by is not None:
+        return list(imported_by)
+
+    reverse_index = _imported_by_index(index)
+    if reverse_index is not None:
+        return list(reverse_index.get(file_path, ()))
 
-    return []
+    return [module for module, info in modules.items() if file_path in info.get("imports", ())]
 
 
 def query_imports(
@@ -133,13 +365,13 @@ def query_imports(
     Returns:
         Dictionary with 'imports' (internal) and 'external' lists, or None.
     """
-    modules = index.get("modules", {})
+    modules = index.get("modules", _EMPTY)
     module_info = modules.get(file_path)
 
     if module_info:
         return {
-            "imports": module_info.get("imports", []),
-            "external": module_info.get("external", []),
+            "imports": list(module_info.get("imports", ())),
+            "external": list(module_info.get("external", ())),
         }
 
     return None
@@ -154,9 +386,11 @@ def get_summary(index: dict[str, Any]) -> dict[str, Any]:
     Returns:
         Summary dictionary with counts and timestamp.
     """
+    # Dependencies indexes count modules instead; only look that up if needed
+    file_count = index["file_count"] if "file_count" in index else index.get("module_count", 0)
     return {
-        "file_count": index.get("file_count", index.get("module_count", 0)),
-        "by_category": index.get("by_category", {}),
+        "file_count": file_count,
+        "by_category": dict(index.get("by_category", _EMPTY)),
         "generated": index.get("generated", "unknown"),
         "schema_version": index.get("schema_version", "unknown"),
     }
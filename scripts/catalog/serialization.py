@@ -0,0 +1,332 @@
+"""Serialization helpers for catalog indexes.
+
+JSON encoding uses orjson when it is installed and falls back to the standard
+library otherwise. Both backends produce equivalent UTF-8 encoded output.
+
+Each JSON index can also get a binary sidecar written with marshal, kept in
+the (untracked) cache directory, which the query loaders read instead of
+re-parsing the JSON. The JSON file remains the source of truth: the sidecar
+records the JSON file's mtime and size, and is only used while both match.
+
+All files are written atomically (temp file + os.replace), so concurrent
+readers never observe a partially written index.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import marshal
+import mmap
+import os
+import struct
+from json.encoder import encode_basestring as _encode_string
+from pathlib import Path
+from typing import IO, Any, Iterator, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+# With orjson, files at least this large are parsed from a memory map
+MMAP_MIN_SIZE = 64 * 1024
+
+# Containers nested deeper than this are encoded in one piece when streaming
+_STREAM_DEPTH = 2
+
+
+def _encode_indented(obj: Any, newline: str = "\n") -> str:
+    """Encode data as 2-space indented JSON without orjson.
+
+    Produces the same text as ``json.dumps(obj, indent=2, ensure_ascii=False)``
+    for the plain dict/list/str/number data found in catalog indexes, but
+    joins whole containers at once and encodes strings with the C-accelerated
+    encoder. Much faster than the stdlib's pure-Python indenting encoder.
+
+    Args:
+        obj: JSON-compatible data (dict keys must be strings).
+        newline: Newline plus the indentation of the current nesting level.
+    """
+    if isinstance(obj, str):
+        return _encode_string(obj)
+    if isinstance(obj, dict):
+        if not obj:
+            return "{}"
+        inner = newline + "  "
+        items = [_encode_string(k) + ": " + _encode_indented(v, inner) for k, v in obj.items()]
+        return "{" + inner + ("," + inner).join(items) + newline + "}"
+    if isinstance(obj, (list, tuple)):
+        if not obj:
+            return "[]"
+        inner = newline + "  "
+        return "[" + inner + ("," + inner).join([_encode_indented(v, inner) for v in obj]) + newline + "]"
+    # Numbers, booleans, and None (raises TypeError for anything else)
+    return json.dumps(obj)
+
+
+def _iterencode_indented(obj: Any, newline: str = "\n", depth: int = _STREAM_DEPTH) -> Iterator[str]:
+    """Yield indented JSON in chunks, one per entry of the outer containers.
+
+    Args:
+        obj: JSON-compatible data (dict keys must be strings).
+        newline: Newline plus the indentation of the current nesting level.
+        depth: Nesting levels still to stream; deeper values are encoded whole.
+    """
+    if depth == 0 or not obj or not isinstance(obj, (dict, list, tuple)):
+        yield _encode_indented(obj, newline)
+        return
+
+    inner = newline + "  "
+    separator = inner
+    if isinstance(obj, dict):
+        yield "{"
+        for k, v in obj.items():
+            yield separator + _encode_string(k) + ": "
+            yield from _iterencode_indented(v, inner, depth - 1)
+            separator = "," + inner
+        yield newline + "}"
+    else:
+        yield "["
+        for v in obj:
+            yield separator
+            yield from _iterencode_indented(v, inner, depth - 1)
+            separator = "," + inner
+        yield newline + "]"
+
+
+def dumps(data: Any, indent: bool = True) -> bytes:
+    """Serialize data to UTF-8 encoded JSON.
+
+    Args:
+        data: JSON-compatible data (dict keys must be strings).
+        indent: If True, pretty-print with 2-space indentation.
+
+    Returns:
+        Encoded JSON bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    if indent:
+        text = _encode_indented(data)
+    else:
+        text = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or a string.
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON (orjson's
+            JSONDecodeError is a subclass).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_file(path: Path | str) -> Any:
+    """Parse a JSON file.
+
+    With orjson, files of MMAP_MIN_SIZE bytes or more are memory-mapped and
+    parsed in place rather than copied into a bytes object first. Smaller
+    files, where the extra syscalls cost more than the copy, are read whole.
+
+    Raises:
+        OSError: If the file cannot be read.
+        json.JSONDecodeError: If the file is not valid JSON.
+    """
+    with open(path, "rb") as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # orjson takes a memoryview, which must be released before
+                # the map can be closed
+                view = memoryview(mm)
+                try:
+                    return orjson.loads(view)
+                finally:
+                    view.release()
+        return loads(f.read())
+
+
+def dumps_str(data: Any, indent: bool = True) -> str:
+    """Serialize data to a JSON string, for printing to the terminal.
+
+    Args:
+        data: JSON-compatible data (dict keys must be strings).
+        indent: If True, pretty-print with 2-space indentation.
+
+    Returns:
+        JSON string.
+    """
+    return dumps(data, indent=indent).decode("utf-8")
+
+
+@contextlib.contextmanager
+def atomic_open(path: Path | str, mode: str = "wb", **kwargs: Any) -> Iterator[IO[Any]]:
+    """Open a file for writing that replaces ``path`` atomically on success.
+
+    Data goes to a hidden temp file in the same directory, which is flushed,
+    fsynced, and renamed over ``path`` when the block exits cleanly. On error
+    the temp file is removed and ``path`` is left untouched.
+
+    Args:
+        path: Destination file path.
+        mode: Write mode passed to open().
+        **kwargs: Extra arguments passed to open() (encoding, buffering, ...).
+
+    Yields:
+        The open temp file.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, mode, **kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+def atomic_write_bytes(path: Path | str, data: bytes) -> None:
+    """Atomically replace a file's contents with ``data``."""
+    with atomic_open(path, "wb") as f:
+        f.write(data)
+
+
+def dump_file(path: Path | str, data: Any, indent: bool = True) -> None:
+    """Atomically write data as JSON to a file.
+
+    With orjson the encoded bytes go out in a single write. Without it,
+    indented output is streamed entry by entry through a large buffer instead
+    of building the whole document as one string first; compact output uses
+    the stdlib's C encoder in one piece.
+
+    Args:
+        path: Destination file path.
+        data: JSON-compatible data (dict keys must be strings).
+        indent: If True, pretty-print with 2-space indentation.
+    """
+    if orjson is not None:
+        atomic_write_bytes(path, orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0))
+        return
+
+    with atomic_open(path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        if indent:
+            f.writelines(_iterencode_indented(data))
+        else:
+            f.write(json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+
+
+SIDECAR_SUFFIX = ".marshal"
+
+# Sidecar header: mtime_ns and size of the JSON index the data was taken from,
+# and the marshal format version
+_SIDECAR_HEADER = struct.Struct("<qqi")
+
+
+def sidecar_path(index_path: Path | str, sidecar_dir: Path | str) -> Path:
+    """Return the binary sidecar path for a JSON index file."""
+    return Path(sidecar_dir) / (Path(index_path).name + SIDECAR_SUFFIX)
+
+
+def write_sidecar(
+    index_path: Path | str,
+    sidecar_dir: Path | str,
+    data: Any,
+    index_mtime_ns: Optional[int] = None,
+    index_size: Optional[int] = None,
+) -> None:
+    """Write the binary sidecar for a JSON index.
+
+    The sidecar records the JSON file's mtime and size, and is only used
+    while both still match. Failures are ignored since the sidecar is only
+    a cache.
+
+    Args:
+        index_path: Path to the JSON index file.
+        sidecar_dir: Directory to write the sidecar to (must exist).
+        data: The index data of the JSON file.
+        index_mtime_ns: The JSON file's mtime when ``data`` was read from it.
+            Defaults to stat()ing the file now, after writing it.
+        index_size: The JSON file's size, as for ``index_mtime_ns``.
+    """
+    try:
+        if index_mtime_ns is None or index_size is None:
+            st = os.stat(index_path)
+            index_mtime_ns, index_size = st.st_mtime_ns, st.st_size
+        payload = marshal.dumps(data)
+        with atomic_open(sidecar_path(index_path, sidecar_dir), "wb") as f:
+            f.write(_SIDECAR_HEADER.pack(index_mtime_ns, index_size, marshal.version))
+            f.write(payload)
+    except (OSError, ValueError):
+        pass
+
+
+def read_sidecar(
+    index_path: Path | str,
+    sidecar_dir: Path | str,
+    index_mtime_ns: Optional[int] = None,
+    index_size: Optional[int] = None,
+) -> Optional[bytes]:
+    """Read the marshalled data of a JSON index's sidecar if it is up to date.
+
+    Args:
+        index_path: Path to the JSON index file.
+        sidecar_dir: Directory holding the sidecar.
+        index_mtime_ns: The JSON file's mtime, if the caller has already
+            stat()ed it; saves a second stat.
+        index_size: The JSON file's size, as for ``index_mtime_ns``.
+
+    Returns:
+        The marshal payload, or None if the sidecar is missing, stale, or
+        unreadable.
+    """
+    try:
+        if index_mtime_ns is None or index_size is None:
+            st = os.stat(index_path)
+            index_mtime_ns, index_size = st.st_mtime_ns, st.st_size
+        with open(sidecar_path(index_path, sidecar_dir), "rb") as f:
+            header = f.read(_SIDECAR_HEADER.size)
+            if len(header) != _SIDECAR_HEADER.size:
+                return None
+            if _SIDECAR_HEADER.unpack(header) != (index_mtime_ns, index_size, marshal.version):
+                return None
+            return f.read()
+    except OSError:
+        return None
+
+
+def load_sidecar(
+    index_path: Path | str,
+    sidecar_dir: Path | str,
+    index_mtime_ns: Optional[int] = None,
+    index_size: Optional[int] = None,
+) -> Optional[Any]:
+    """Load the binary sidecar for a JSON index if it is up to date.
+
+    Args:
+        index_path: Path to the JSON index file.
+        sidecar_dir: Directory holding the sidecar.
+        index_mtime_ns: The JSON file's mtime, if the caller has already
+            stat()ed it; saves a second stat.
+        index_size: The JSON file's size, as for ``index_mtime_ns``.
+
+    Returns:
+        Index data, or None if the sidecar is missing, stale, or unreadable.
+    """
+    payload = read_sidecar(index_path, sidecar_dir, index_mtime_ns, index_size)
+    if payload is None:
+        return None
+    try:
+        return marshal.loads(payload)
+    except (EOFError, ValueError, TypeError):
+        return None